@@ -8,13 +8,21 @@ import json
 import os
 import csv
 import random
+import re
+import shutil
+import subprocess
+import logging
+import threading
+import time
 from datetime import datetime, timedelta
+from functools import partial
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QGridLayout, QFrame, QPushButton,
                              QMessageBox, QScrollArea, QApplication, QDialog,
-                             QLineEdit, QDialogButtonBox, QFormLayout, QFileDialog, QComboBox)
-from PyQt6.QtGui import QFont, QIcon
-from PyQt6.QtCore import Qt, QTimer
+                             QLineEdit, QDialogButtonBox, QFormLayout, QFileDialog, QComboBox,
+                             QCheckBox, QMenu)
+from PyQt6.QtGui import QFont, QIcon, QGuiApplication
+from PyQt6.QtCore import Qt, QTimer, QEvent, QMetaObject, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PyQt6.QtCore import QUrl
 from mute_manager import get_mute_manager
@@ -22,9 +30,18 @@ import os
 import json
 import sys
 
+# Debug output goes through logging - disabled unless the app configures DEBUG level
+log = logging.getLogger(__name__)
+
+# orjson is optional - when installed it parses/writes the ack list several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import with error handling
 try:
-    from scheduler import get_manifest_status
+    from scheduler import get_manifest_status, parse_manifest_time
     from data_manager import load_config
     from settings_manager import get_settings_manager
 except ImportError:
@@ -34,12 +51,16 @@ except ImportError:
     except:
         pass  # Ignore console output errors
     
-    def get_manifest_status(time_str, now):
+    def parse_manifest_time(time_str):
+        hour, minute = time_str.split(':')
+        return int(hour), int(minute)
+    
+    def get_manifest_status(slot_time, now):
         # Emergency fallback - try basic time comparison
-        from datetime import datetime, timedelta
+        # slot_time is "HH:MM" or a pre-parsed (hour, minute) tuple
         try:
-            today = now.date()
-            manifest_time = datetime.strptime(time_str, "%H:%M").replace(year=today.year, month=today.month, day=today.day)
+            hour, minute = parse_manifest_time(slot_time) if isinstance(slot_time, str) else slot_time
+            manifest_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
             if now >= manifest_time + timedelta(minutes=30):
                 return "Missed"
             elif now >= manifest_time - timedelta(minutes=2):
@@ -59,6 +80,639 @@ except ImportError:
         return DummySettings()
 
 
+# One carrier name from a semicolon-separated CSV field, without surrounding whitespace
+_CARRIER_RE = re.compile(r'[^;\s][^;]*[^;\s]|[^;\s]')
+
+# Shared fonts - QFont is a value type, so one instance per style is built at import
+# and copied by setFont() instead of re-resolving the font on every card rebuild
+_FONT_TITLE = QFont("Segoe UI", 42, QFont.Weight.Bold)
+_FONT_CLOCK = QFont("DS-Digital", 42, QFont.Weight.Bold)  # 7-segment display look
+_FONT_BUTTON = QFont("Segoe UI", 16, QFont.Weight.Bold)
+_FONT_SUMMARY = QFont("Segoe UI", 22, QFont.Weight.Bold)
+_FONT_NO_DATA = QFont("Segoe UI", 24, QFont.Weight.Bold)
+_FONT_SECTION_TITLE = QFont("Segoe UI", 12, QFont.Weight.Bold)
+_FONT_TIME_STATUS = QFont("Segoe UI", 28, QFont.Weight.Bold)
+_FONT_TIME_STATUS_MAXIMIZED = QFont("Segoe UI", 36, QFont.Weight.Bold)
+_FONT_CARRIER = QFont("Segoe UI", 22)
+_FONT_ACK_DETAILS = QFont("Segoe UI", 18)  # Slightly smaller than carrier font
+_FONT_DETAILS_MAXIMIZED = QFont("Segoe UI", 18, QFont.Weight.Normal)
+_FONT_DETAILS_NORMAL = QFont("Segoe UI", 14, QFont.Weight.Normal)
+
+# Card border/header color per card status (anything unknown renders as OPEN)
+_STATUS_COLORS = {
+    "ACTIVE": "#ff4757",
+    "MISSED": "#c44569",
+    "ACKNOWLEDGED": "#2ed573",
+    "OPEN": "#3742fa",
+}
+
+
+def _build_card_qss():
+    """Single StatusCard stylesheet - state changes flip dynamic properties, not sheets"""
+    rules = ["""
+            StatusCard {
+                background: transparent;
+                border-radius: 12px;
+            }
+            StatusCard QLabel {
+                background: transparent;
+            }
+        """]
+    for status, color in _STATUS_COLORS.items():
+        # Hover thickens the border
+        rules.append(f"""
+            StatusCard[cardStatus="{status}"] {{
+                border: 2px solid {color};
+            }}
+            StatusCard[cardStatus="{status}"][cardHovered="true"] {{
+                border: 3px solid {color};
+            }}
+            QLabel#timeStatus[cardStatus="{status}"] {{
+                color: {color};
+            }}
+        """)
+    rules.append("""
+            QLabel[carrierStatus="Acknowledged"] { color: #2ed573; }
+            QLabel[carrierStatus="AcknowledgedLate"] { color: #ffb347; }
+            QLabel[carrierStatus="Active"] { color: #ffffff; border-radius: 5px; }
+            QLabel[carrierStatus="Missed"] { color: #ff4757; border-radius: 5px; }
+            QLabel[carrierStatus="Open"] { color: #ffffff; }
+            QLabel[ackStatus="late"] { color: #ffb347; }
+            QLabel[ackStatus="done"] { color: #2ed573; }
+        """)
+    # Maximized mode: transparent so the red flash shows through (outlines the labels too)
+    rules.append("""
+            StatusCard[cardMaximized="true"], StatusCard[cardMaximized="true"] QFrame {
+                background: transparent;
+                border: 3px solid #3742fa;
+                border-radius: 15px;
+            }
+        """)
+    return "".join(rules)
+
+
+_CARD_QSS = _build_card_qss()
+
+
+# Main window stylesheet - the flash only flips the flashOn property, the sheet is set once
+_MAIN_QSS = """
+            AlertDisplay[flashOn="true"] {
+                background-color: #FF0000;
+                color: #ffffff;
+                font-family: 'Segoe UI', Arial, sans-serif;
+            }
+            AlertDisplay[flashOn="false"] {
+                background-color: #000000;
+                color: #ffffff;
+                font-family: 'Segoe UI', Arial, sans-serif;
+            }
+            QLabel {
+                background: transparent;
+                color: inherit;
+            }
+            QPushButton {
+                background-color: #3742fa;
+                color: #ffffff;
+                border: none;
+                border-radius: 8px;
+                padding: 15px 30px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #4f69ff;
+            }
+            QPushButton:pressed {
+                background-color: #2c35e6;
+            }
+            AlertDisplay[flashOn="true"] QFrame {
+                background-color: #FF0000;
+                color: #ffffff;
+            }
+            AlertDisplay[flashOn="false"] QFrame {
+                background-color: #000000;
+                color: #ffffff;
+            }
+            AlertDisplay[flashOn="true"] QScrollArea {
+                background-color: #FF0000;
+                color: #ffffff;
+            }
+            AlertDisplay[flashOn="false"] QScrollArea {
+                background-color: #000000;
+                color: #ffffff;
+            }
+            QMessageBox {
+                background-color: #1a1a2e;
+                color: #ffffff;
+                font-size: 16px;
+            }
+            QMessageBox QLabel {
+                color: #ffffff;
+                font-size: 16px;
+            }
+            QMessageBox QPushButton {
+                background-color: #3742fa;
+                color: #ffffff;
+                border: none;
+                border-radius: 5px;
+                padding: 8px 16px;
+                font-size: 14px;
+                font-weight: bold;
+                min-width: 80px;
+            }
+            QMessageBox QPushButton:hover {
+                background-color: #4f69ff;
+            }
+        """
+
+
+# Snooze button, settings dialog and monitor menu stylesheets - shared constants instead of per-call literals
+_SNOOZE_MUTED_QSS = """
+                QPushButton {
+                    background-color: #ff4757;
+                    color: #ffffff;
+                    border: 2px solid #ff4757;
+                    border-radius: 20px;
+                    padding: 0px;
+                }
+                QPushButton:hover {
+                    background-color: #ff3838;
+                }
+                QPushButton:pressed {
+                    background-color: #e84118;
+                }
+            """
+
+_SNOOZE_UNMUTED_QSS = """
+                QPushButton {
+                    background-color: #2c2c54;
+                    color: #ffffff;
+                    border: 2px solid #3742fa;
+                    border-radius: 20px;
+                    padding: 0px;
+                }
+                QPushButton:hover {
+                    background-color: #3742fa;
+                }
+                QPushButton:pressed {
+                    background-color: #1f2ecc;
+                }
+            """
+
+_SETTINGS_DIALOG_QSS = """
+            QDialog {
+                background-color: #1a1a2e;
+                color: #ffffff;
+            }
+            QLabel {
+                color: #ffffff;
+                font-size: 14px;
+            }
+            QLineEdit {
+                background-color: #2c2c54;
+                border: 2px solid #3742fa;
+                border-radius: 5px;
+                padding: 8px;
+                color: #ffffff;
+                font-size: 14px;
+            }
+            QLineEdit:focus {
+                border-color: #4f69ff;
+            }
+            QLineEdit.error {
+                border-color: #ff4757;
+                background-color: #3d1a1a;
+            }
+            QPushButton {
+                background-color: #3742fa;
+                color: #ffffff;
+                border: none;
+                border-radius: 5px;
+                padding: 8px 16px;
+                font-weight: bold;
+                min-height: 20px;
+            }
+            QPushButton:hover {
+                background-color: #4f69ff;
+            }
+            QPushButton:disabled {
+                background-color: #555555;
+                color: #999999;
+            }
+            .status-label {
+                font-size: 12px;
+                padding: 5px;
+                border-radius: 3px;
+            }
+            .status-valid {
+                color: #2ed573;
+                background-color: #1b2d1b;
+            }
+            .status-invalid {
+                color: #ff4757;
+                background-color: #3d1a1a;
+            }
+        """
+
+_MONITOR_COMBO_QSS = """
+            QComboBox {
+                background-color: #2c2c54;
+                border: 2px solid #3742fa;
+                border-radius: 5px;
+                padding: 8px;
+                color: #ffffff;
+                font-size: 14px;
+            }
+            QComboBox::drop-down {
+                border: none;
+            }
+            QComboBox::down-arrow {
+                image: none;
+                border-left: 5px solid transparent;
+                border-right: 5px solid transparent;
+                border-top: 5px solid #ffffff;
+            }d
+        """
+
+_TV_CHECKBOX_QSS = """
+            QCheckBox {
+                color: #ffffff;
+                font-size: 14px;
+                spacing: 8px;
+            }
+            QCheckBox::indicator {
+                width: 20px;
+                height: 20px;
+                border: 2px solid #3742fa;
+                border-radius: 4px;
+                background-color: #2c2c54;
+            }
+            QCheckBox::indicator:checked {
+                background-color: #3742fa;
+                border-color: #4f69ff;
+            }
+            QCheckBox::indicator:checked::after {
+                content: "✓";
+                color: white;
+                font-size: 14px;
+                font-weight: bold;
+            }
+        """
+
+_CSV_GROUP_QSS = """
+            QWidget {
+                background-color: #2c2c54;
+                border: 1px solid #3742fa;
+                border-radius: 8px;
+                padding: 10px;
+            }
+        """
+
+
+def _csv_button_qss(bg, hover, pressed):
+    """Settings dialog CSV button - the four buttons differ only in colour"""
+    return f"""
+            QPushButton {{
+                background-color: {bg};
+                color: #ffffff;
+                border: none;
+                border-radius: 5px;
+                padding: 10px 16px;
+                font-weight: bold;
+                min-height: 20px;
+            }}
+            QPushButton:hover {{
+                background-color: {hover};
+            }}
+            QPushButton:pressed {{
+                background-color: {pressed};
+            }}
+        """
+
+
+_EXPORT_ACK_BTN_QSS = _csv_button_qss('#27ae60', '#2ecc71', '#1e8449')
+_EXPORT_CONFIG_BTN_QSS = _csv_button_qss('#f39c12', '#f1c40f', '#d68910')
+_IMPORT_CONFIG_BTN_QSS = _csv_button_qss('#e74c3c', '#ec7063', '#c0392b')
+_OPEN_FOLDER_BTN_QSS = _csv_button_qss('#9b59b6', '#af7ac5', '#7d3c98')
+
+
+_MONITOR_MENU_QSS = """
+            QMenu {
+                background-color: #1a1a2e;
+                color: #ffffff;
+                border: 2px solid #3742fa;
+                border-radius: 8px;
+                padding: 5px;
+                font-size: 14px;
+            }
+            QMenu::item {
+                padding: 8px 16px;
+                border-radius: 4px;
+            }
+            QMenu::item:selected {
+                background-color: #3742fa;
+            }
+        """
+
+
+def _repolish(widget):
+    """Re-evaluate property selectors after a dynamic property change"""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    # Let QFrame recompute its frame width when the border changes
+    QApplication.sendEvent(widget, QEvent(QEvent.Type.StyleChange))
+
+
+_APP_ICON = None
+
+
+def get_app_icon():
+    """Shared application icon - icon.ico is decoded once and reused by every window"""
+    global _APP_ICON
+    if _APP_ICON is None:
+        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', 'icon.ico')
+        _APP_ICON = QIcon(icon_path) if os.path.exists(icon_path) else QIcon()
+    return _APP_ICON
+
+
+# Open a file/folder with the OS default application - the platform is resolved once at import
+if sys.platform == 'win32':
+    def open_with_default_app(path):
+        os.startfile(path)
+else:
+    _OPEN_COMMAND = 'open' if sys.platform == 'darwin' else 'xdg-open'  # macOS / Linux
+    
+    def open_with_default_app(path):
+        subprocess.call([_OPEN_COMMAND, path])
+
+
+def _load_json(f):
+    """json.load for a file opened in binary mode, via orjson when available"""
+    if orjson is None:
+        return json.load(f)
+    # json.load accepts a UTF-8 BOM (files saved from Notepad), orjson does not
+    return orjson.loads(f.read().removeprefix(b'\xef\xbb\xbf'))
+
+
+def _atomic_json_dump(path, obj, indent=None, durable=False):
+    """Write JSON to path + '.tmp' then os.replace() it in - a crash mid-write never truncates the file.
+    
+    indent=None writes compact JSON for machine-read files such as ack.json.
+    durable=True fsyncs before the rename - kept for config.json, not the per-click ack flush.
+    """
+    # Serialize up front so the (often network) file gets one write instead of json.dump's many small ones
+    if orjson is not None and indent in (None, 2):
+        payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    elif indent is None:
+        payload = json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    else:
+        payload = json.dumps(obj, indent=indent, ensure_ascii=False).encode('utf-8')
+    
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())  # Contents on disk before the rename publishes them
+        for attempt in range(4):
+            try:
+                os.replace(tmp_path, path)
+                break
+            except PermissionError:
+                # Windows/SMB sharing violation while another station has the file open - back off briefly
+                if attempt == 3:
+                    raise
+                time.sleep(0.05 * 2 ** attempt)
+    except BaseException:
+        # Don't leave a half-written temp file next to the real one
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def probe_folder(folder_path, write_test=False):
+    """'writable', 'read_only', 'not_dir' or 'missing' for a data folder candidate.
+    
+    Without write_test this is a cheap os.access() check for as-you-type feedback - on Windows
+    it ignores share ACLs and reports every directory writable. write_test=True creates and
+    removes a test file, the only reliable check on UNC shares.
+    """
+    if not os.path.exists(folder_path):
+        return "missing"
+    if not os.path.isdir(folder_path):
+        return "not_dir"
+    
+    if not write_test:
+        return "writable" if os.access(folder_path, os.W_OK) else "read_only"
+    
+    # Check if we can write to this directory
+    try:
+        test_file = os.path.join(folder_path, 'test_write.tmp')
+        with open(test_file, 'w') as f:
+            f.write('test')
+        os.remove(test_file)
+        return "writable"
+    except (PermissionError, OSError):
+        return "read_only"
+
+
+def format_ack_display(ack_info):
+    """Return (user_name, " at HH:MM" or "") for an acknowledgment entry"""
+    user_name = ack_info.get('user', 'Unknown')
+    timestamp = ack_info.get('timestamp', '')
+    
+    # Format timestamp to show just time
+    time_str = ""
+    if timestamp:
+        try:
+            ack_time = datetime.fromisoformat(timestamp)
+            time_str = f" at {ack_time.hour:02d}:{ack_time.minute:02d}"
+        except:
+            pass
+    return user_name, time_str
+
+
+def write_ack_csv(ack_path, file_path):
+    """Write ack.json out as CSV - returns False when there is no acknowledgment data"""
+    try:
+        with open(ack_path, 'rb') as f:
+            ack_data = _load_json(f)
+    except FileNotFoundError:
+        ack_data = None
+    
+    if not ack_data:
+        return False
+    
+    # Export CSV data
+    with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+        fieldnames = ['date', 'manifest_time', 'carrier', 'user', 'reason', 'timestamp']
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
+        
+        # Write header
+        writer.writerow(dict(zip(fieldnames, ['Date', 'Time', 'Carrier', 'User', 'Reason', 'Timestamp'])))
+        
+        # Handle list format (correct format used by the system)
+        if isinstance(ack_data, list):
+            # Ack entries are already keyed by the field names - missing keys write as ''
+            writer.writerows(ack_item for ack_item in ack_data if isinstance(ack_item, dict))
+        else:
+            # Handle old nested dictionary format for backward compatibility
+            for date_key, date_data in ack_data.items():
+                if isinstance(date_data, dict):
+                    for time_key, time_data in date_data.items():
+                        if isinstance(time_data, dict):
+                            writer.writerow({**time_data, 'date': date_key,
+                                             'manifest_time': time_key, 'carrier': ''})
+    
+    return True
+
+
+def write_config_csv(manifests, file_path):
+    """Write manifests out as an importable time,carriers CSV"""
+    with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        
+        # Write header matching import format
+        writer.writerow(['time', 'carriers'])
+        
+        # Write data rows in importable format - carriers joined with semicolon for easy import parsing
+        writer.writerows([manifest.get('time', ''), ';'.join(manifest.get('carriers') or ())]
+                         for manifest in manifests)
+    
+    return True
+
+
+def ack_file_stamp(ack_path):
+    """(ack_path, mtime_ns, size) cache key for ack.json - the size catches a write from another PC
+    within the same mtime tick on shares with coarse timestamps (SMB/FAT)"""
+    st = os.stat(ack_path)
+    return ack_path, st.st_mtime_ns, st.st_size
+
+
+def read_ack_records(stamp):
+    """(stamp, ack list, first-wins (date, manifest_time, carrier) index) for an ack_file_stamp() stamp"""
+    try:
+        with open(stamp[0], 'rb') as f:
+            ack_data = _load_json(f)
+    except (FileNotFoundError, ValueError):
+        # Missing or unreadable JSON starts a fresh list; other I/O errors abort the ack
+        # rather than overwrite a file we couldn't read
+        ack_data = []
+    
+    ack_index = {}
+    for ack in ack_data:
+        # First entry wins, as with the old linear scan
+        ack_index.setdefault((ack.get('date'), ack.get('manifest_time'), ack.get('carrier')), ack)
+    return stamp, ack_data, ack_index
+
+
+class AckLoadSignals(QObject):
+    """Signals for AckLoadWorker - emitted on the pool thread, delivered on the GUI thread"""
+    loaded = pyqtSignal(object)  # read_ack_records() result
+
+
+class AckLoadWorker(QRunnable):
+    """Reads and indexes ack.json off the GUI thread"""
+    
+    def __init__(self, ack_path):
+        super().__init__()
+        self.ack_path = ack_path
+        self.signals = AckLoadSignals()
+    
+    def run(self):
+        try:
+            try:
+                stamp = ack_file_stamp(self.ack_path)
+            except FileNotFoundError:
+                stamp = (self.ack_path, None, None)
+            self.signals.loaded.emit(read_ack_records(stamp))
+        except Exception:
+            pass  # The ack path loads synchronously on first use instead
+
+
+def backup_config(data_folder):
+    """Copy config.json to backup/config_backup_<timestamp>.json - False if there was nothing to back up"""
+    try:
+        # Create backup folder if it doesn't exist
+        backup_folder = os.path.join(data_folder, 'backup')
+        os.makedirs(backup_folder, exist_ok=True)
+        
+        # Create timestamped backup
+        now = datetime.now()
+        timestamp = f"{now.year}{now.month:02d}{now.day:02d}_{now.hour:02d}{now.minute:02d}{now.second:02d}"
+        backup_filename = f"config_backup_{timestamp}.json"
+        backup_path = os.path.join(backup_folder, backup_filename)
+        
+        # Copy contents only - the backup doesn't need the original's metadata
+        shutil.copyfile(os.path.join(data_folder, 'config.json'), backup_path)
+        
+        return True
+        
+    except FileNotFoundError:
+        return False  # No config.json yet
+    except Exception as e:
+        try:
+            print(f"Backup creation failed: {e}")
+        except:
+            pass  # Ignore console output errors
+        return False
+
+
+class ConfigBackupSignals(QObject):
+    """Signals for ConfigBackupWorker - emitted on the pool thread, delivered on the GUI thread"""
+    finished = pyqtSignal(bool)  # True when the backup was written
+
+
+class ConfigBackupWorker(QRunnable):
+    """Config backup copy off the GUI thread (the data folder is often a network share)"""
+    
+    def __init__(self, data_folder):
+        super().__init__()
+        self.data_folder = data_folder
+        self.signals = ConfigBackupSignals()
+    
+    def run(self):
+        self.signals.finished.emit(backup_config(self.data_folder))
+
+
+class CsvExportSignals(QObject):
+    """Signals for CsvExportWorker - emitted on the pool thread, delivered on the GUI thread"""
+    finished = pyqtSignal(str)  # Exported file path, '' when there was nothing to export
+    failed = pyqtSignal(str)    # Error text for the dialog
+
+
+class CsvExportWorker(QRunnable):
+    """CSV export write off the GUI thread - write_csv(file_path) returns False when there is nothing to export.
+    Excel is launched by the finished slot on the GUI thread (shell APIs expect the STA main thread)"""
+    
+    def __init__(self, write_csv, file_path, what):
+        super().__init__()
+        self.write_csv = write_csv
+        self.file_path = file_path
+        self.what = what  # "acknowledgment data" / "configuration data" for error text
+        self.signals = CsvExportSignals()
+    
+    def run(self):
+        try:
+            if not self.write_csv(self.file_path):
+                self.signals.finished.emit('')
+                return
+            
+            self.signals.finished.emit(self.file_path)
+            
+        except PermissionError as e:
+            self.signals.failed.emit(f"Failed to export {self.what}:\n\n"
+                                     f"The file may be open in Excel or another program.\n"
+                                     f"Please close the file and try again.\n\n"
+                                     f"File: {self.file_path}\n"
+                                     f"Error: {str(e)}")
+        except Exception as e:
+            self.signals.failed.emit(f"Failed to export {self.what}:\n\n{str(e)}")
+
+
 class StatusCard(QFrame):
     """Modern status card widget with dynamic scaling"""
     
@@ -69,9 +723,13 @@ class StatusCard(QFrame):
         self.manifests = []
         self.parent_display = parent_display  # Reference to main display for acknowledgments
         self.is_maximized = False  # Track if this card is in maximized mode
+        self._hovered = False  # Card border hover highlight
+        self._last_counts = None  # (acked, missed, active, total) last applied by update_card_status
+        self._style_key = None  # (status, hovered, maximized) last polished by update_styling
         
         self.setMinimumSize(1200, 80)  # Default minimum height
         self.setFrameStyle(QFrame.Shape.Box)
+        self.setStyleSheet(_CARD_QSS)  # Set once - states are switched via properties
         self.setup_ui()
         self.update_styling()
         
@@ -81,52 +739,30 @@ class StatusCard(QFrame):
         self.mousePressEvent = self.card_clicked
     
     def setup_ui(self):
-        layout = QHBoxLayout()  # Main horizontal layout
+        # Single grid: time/status | carriers | acknowledgments, with a stretch row below
+        layout = QGridLayout(self)
         layout.setContentsMargins(10, 3, 10, 3)  # Even smaller margins - reduced from 15,5 to 10,3
-        layout.setSpacing(15)  # Reduced spacing between sections
-        
-        # Left side - Time and Status (fixed width for consistent alignment)
-        time_status_layout = QVBoxLayout()
-        time_status_layout.setSpacing(0)  # No spacing in time section
-        time_status_layout.setContentsMargins(0, 0, 0, 0)  # No margins
+        layout.setHorizontalSpacing(15)  # Reduced spacing between sections
+        layout.setVerticalSpacing(0)
         
-        # Combined time and status header
+        # Left side - Combined time and status header (fixed width for consistent alignment)
         self.time_status_label = QLabel(f"{self.time_str} - {self.status}")
         self.time_status_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
-        self.time_status_label.setFont(QFont("Segoe UI", 28, QFont.Weight.Bold))  # Increased from 24 to 28
+        self.time_status_label.setFont(_FONT_TIME_STATUS)
         self.time_status_label.setFixedWidth(280)  # Consistent fixed width for alignment
         self.time_status_label.mouseDoubleClickEvent = self.time_header_double_clicked
         # Set up hover effects with mouse events
         self.time_status_label.enterEvent = self.time_header_hover_enter
         self.time_status_label.leaveEvent = self.time_header_hover_leave
-        self.time_status_label.setStyleSheet("""
-            QLabel {
-                padding: 2px;
-                border-radius: 8px;
-                background: transparent;
-            }
-        """)
-        time_status_layout.addWidget(self.time_status_label)
-        time_status_layout.addStretch()
-        
-        layout.addLayout(time_status_layout)
+        self.time_status_label.setObjectName("timeStatus")
+        layout.addWidget(self.time_status_label, 0, 0, Qt.AlignmentFlag.AlignTop)
         
-        # Center - Manifest details (carriers) - takes remaining space
-        center_layout = QVBoxLayout()
-        center_layout.setSpacing(0)  # No spacing in center section
-        center_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Create a horizontal layout for carriers and individual acknowledgments side by side
-        carriers_ack_layout = QHBoxLayout()
-        carriers_ack_layout.setSpacing(15)  # Spacing between carriers and ack sections
-        carriers_ack_layout.setContentsMargins(0, 0, 0, 0)  # No margins
-        
-        # Left part: carriers (will be recreated as clickable labels)
+        # Center - carriers (will be recreated as clickable labels) - takes remaining space
         self.carriers_widget = QWidget()
         self.carriers_layout = QVBoxLayout(self.carriers_widget)
         self.carriers_layout.setContentsMargins(0, 0, 0, 0)
         self.carriers_layout.setSpacing(1)  # Extremely tight - reduced from 2 to 1
-        carriers_ack_layout.addWidget(self.carriers_widget)
+        layout.addWidget(self.carriers_widget, 0, 1)
         
         # Right part: individual acknowledgments (650px width as specified)
         self.ack_widget = QWidget()
@@ -136,50 +772,37 @@ class StatusCard(QFrame):
         self.ack_layout = QVBoxLayout(self.ack_widget)
         self.ack_layout.setContentsMargins(0, 0, 0, 0)  # No margins
         self.ack_layout.setSpacing(1)  # Match carrier spacing for alignment
-        carriers_ack_layout.addWidget(self.ack_widget)
-        
-        center_layout.addLayout(carriers_ack_layout)
-        center_layout.addStretch()
+        layout.addWidget(self.ack_widget, 0, 2)
         
-        layout.addLayout(center_layout)
+        # Carriers expand horizontally; the empty row keeps content pinned to the top
+        layout.setColumnStretch(1, 1)
+        layout.setRowStretch(1, 1)
         
         # Remove redundant status bar - card border provides sufficient visual indication
-        self.setLayout(layout)
     
     def update_styling(self):
         """Update colors based on status - only borders and font colors on black background"""
-        if self.status == "ACTIVE":
-            border_color = "#ff4757"
-            text_color = "#ffffff"
-            status_color = "#ff4757"
-        elif self.status == "MISSED":
-            border_color = "#c44569"
-            text_color = "#ffffff"
-            status_color = "#c44569"
-        elif self.status == "ACKNOWLEDGED":
-            border_color = "#2ed573"
-            text_color = "#ffffff"
-            status_color = "#2ed573"
-        else:  # OPEN
-            border_color = "#3742fa"
-            text_color = "#ffffff"
-            status_color = "#3742fa"
-        
-        self.setStyleSheet(f"""
-            StatusCard {{
-                background: transparent;
-                border: 2px solid {border_color};
-                border-radius: 12px;
-            }}
-        """)
+        status = self.status if self.status in _STATUS_COLORS else "OPEN"
+        hovered = self._hovered and not self.is_maximized
+        
+        # Every rebuild resets each card's mode - only re-polish when a selector input changed
+        style_key = (status, hovered, self.is_maximized)
+        if style_key == self._style_key:
+            return
+        self._style_key = style_key
         
-        self.time_status_label.setStyleSheet(f"color: {status_color}; background: transparent;")
+        self.setProperty("cardStatus", status)
+        self.setProperty("cardHovered", hovered)
+        self.setProperty("cardMaximized", self.is_maximized)
+        self.time_status_label.setProperty("cardStatus", status)
+        _repolish(self)
+        _repolish(self.time_status_label)
     
-    def set_manifests(self, manifests):
-        """Update manifest details"""
+    def set_manifests(self, manifests, acks=None):
+        """Update manifest details (acks: lookup dict already loaded by the parent display)"""
         self.manifests = manifests
         if manifests:
-            self.update_manifest_display()
+            self.update_manifest_display(acks)
         else:
             # Clear both carrier and acknowledgment layouts
             for i in reversed(range(self.carriers_layout.count())):
@@ -190,6 +813,12 @@ class StatusCard(QFrame):
                 child = self.ack_layout.itemAt(i).widget()
                 if child:
                     child.setParent(None)
+            
+            # update_card_status skips empty slots - reset a reused card to a fresh card's OPEN header
+            self.status = "OPEN"
+            self._last_counts = None
+            self.time_status_label.setText(f"{self.time_str} - {self.status}")
+            self.update_styling()
     
     def set_acknowledgment(self, user_info, reason=None):
         """Compatibility method for old acknowledgment system - now handled per-carrier"""
@@ -202,25 +831,25 @@ class StatusCard(QFrame):
     
     def card_hover_enter(self, event):
         """Handle mouse enter on card border"""
-        # Add subtle card border highlight
-        current_style = self.styleSheet()
-        if "border: 3px solid" not in current_style:
-            # Increase border thickness slightly for hover effect
-            for status in ["ACTIVE", "MISSED", "ACKNOWLEDGED", "OPEN"]:
-                if status.lower() in current_style.lower():
-                    current_style = current_style.replace("border: 2px solid", "border: 3px solid")
-                    break
-            self.setStyleSheet(current_style)
+        # Add subtle card border highlight (thicker border)
+        self.set_hovered(True)
     
     def card_hover_leave(self, event):
         """Handle mouse leave on card"""
         # Remove card border highlight
-        current_style = self.styleSheet()
-        current_style = current_style.replace("border: 3px solid", "border: 2px solid")
-        self.setStyleSheet(current_style)
+        self.set_hovered(False)
         # Also ensure time header highlight is removed
         self.time_header_hover_leave(event)
     
+    def set_hovered(self, hovered):
+        """Switch between the precomputed normal/hovered card stylesheets"""
+        if hovered == self._hovered:
+            return
+        self._hovered = hovered
+        # Maximized mode has its own border - just remember the state
+        if not self.is_maximized:
+            self.update_styling()
+    
     def time_header_double_clicked(self, event):
         """Handle double-click on time header to acknowledge whole card"""
         if (self.status in ["ACTIVE", "MISSED"] and 
@@ -238,8 +867,17 @@ class StatusCard(QFrame):
         # No background color hover effects - keep clean appearance
         pass
     
-    def update_manifest_display(self):
+    def update_manifest_display(self, acks=None):
         """Update the manifest display with individual clickable carriers and acknowledgment labels"""
+        # Batch all label/style/height changes into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._rebuild_manifest_display(acks)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _rebuild_manifest_display(self, acks):
+        """Recreate carrier and acknowledgment labels (caller batches repaints)"""
         # Clear existing carrier labels
         for i in reversed(range(self.carriers_layout.count())):
             child = self.carriers_layout.itemAt(i).widget()
@@ -254,70 +892,57 @@ class StatusCard(QFrame):
         
         if self.manifests:
             # Load acknowledgments for this time slot
-            acknowledgments = self.get_acknowledgments_for_time_slot()
+            acknowledgments = self.get_acknowledgments_for_time_slot(acks)
             
             for carrier, status in self.manifests:
                 # Create individual carrier label
                 carrier_label = QLabel()
-                carrier_label.setFont(QFont("Segoe UI", 22))  # Increased from 18 to 22
+                carrier_label.setFont(_FONT_CARRIER)
                 carrier_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
                 
-                # Set text and styling based on status (clean display)
-                if status == "Acknowledged":
-                    carrier_label.setText(carrier)
-                    carrier_label.setStyleSheet("color: #2ed573; background: transparent;")
-                elif status == "AcknowledgedLate":
-                    carrier_label.setText(carrier)
-                    carrier_label.setStyleSheet("color: #ffb347; background: transparent;")
-                elif status == "Active":
-                    carrier_label.setText(carrier)
-                    carrier_label.setStyleSheet("color: #ffffff; background: transparent; border-radius: 5px;")
+                # Set text and styling based on status (clean display) - colors come from _CARD_QSS
+                carrier_label.setText(carrier)
+                if status in ("Acknowledged", "AcknowledgedLate", "Active", "Missed"):
+                    carrier_label.setProperty("carrierStatus", status)
+                else:
+                    carrier_label.setProperty("carrierStatus", "Open")
+                
+                if status == "Active":
                     # Make active items clickable and hoverable
                     carrier_label.mousePressEvent = lambda event, c=carrier: self.acknowledge_single_carrier(c)
                     carrier_label.enterEvent = lambda event, label=carrier_label: self.carrier_hover_enter(label, "#ff4757")
                     carrier_label.leaveEvent = lambda event, label=carrier_label: self.carrier_hover_leave(label)
                 elif status == "Missed":
-                    carrier_label.setText(carrier)
-                    carrier_label.setStyleSheet("color: #ff4757; background: transparent; border-radius: 5px;")
                     # Make missed items clickable and hoverable
                     carrier_label.mousePressEvent = lambda event, c=carrier: self.acknowledge_single_carrier(c)
                     carrier_label.enterEvent = lambda event, label=carrier_label: self.carrier_hover_enter(label, "#c44569")
                     carrier_label.leaveEvent = lambda event, label=carrier_label: self.carrier_hover_leave(label)
-                else:  # Open
-                    carrier_label.setText(carrier)
-                    carrier_label.setStyleSheet("color: #ffffff; background: transparent;")
                 
                 self.carriers_layout.addWidget(carrier_label)
                 
                 # Create corresponding individual acknowledgment label
                 ack_label = QLabel()
-                ack_label.setFont(QFont("Segoe UI", 18))  # Slightly smaller than carrier font (22 vs 18)
+                ack_label.setFont(_FONT_ACK_DETAILS)
                 ack_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop)
-                ack_label.setStyleSheet("background: transparent;")
                 ack_label.setWordWrap(False)  # Ensure single line as per requirements
                 
                 # Set acknowledgment text based on status and data
                 if carrier in acknowledgments:
                     ack_info = acknowledgments[carrier]
-                    user_name = ack_info.get('user', 'Unknown')
                     reason = ack_info.get('reason', '')
-                    timestamp = ack_info.get('timestamp', '')
                     
-                    # Format timestamp to show just time
-                    time_str = ""
-                    if timestamp:
-                        try:
-                            ack_time = datetime.fromisoformat(timestamp)
-                            time_str = f" at {ack_time.strftime('%H:%M')}"
-                        except:
-                            pass
+                    # User name and " at HH:MM" suffix (cached per ack file version)
+                    if self.parent_display and hasattr(self.parent_display, 'get_ack_display'):
+                        user_name, time_str = self.parent_display.get_ack_display(self.time_str, carrier, ack_info)
+                    else:
+                        user_name, time_str = format_ack_display(ack_info)
                     
                     if reason == "Done Late":
                         ack_label.setText(f"Done Late by {user_name}{time_str}")
-                        ack_label.setStyleSheet("color: #ffb347; background: transparent;")  # Orange for late
+                        ack_label.setProperty("ackStatus", "late")  # Orange for late
                     elif status in ["Acknowledged", "AcknowledgedLate"]:
                         ack_label.setText(f"Done by {user_name}{time_str}")
-                        ack_label.setStyleSheet("color: #2ed573; background: transparent;")  # Green for done
+                        ack_label.setProperty("ackStatus", "done")  # Green for done
                     else:
                         ack_label.setText("")  # No acknowledgment yet
                 else:
@@ -348,14 +973,6 @@ class StatusCard(QFrame):
         # No background colors to remove, just leave as is
         pass
     
-    def hex_to_rgba(self, hex_color, alpha):
-        """Convert hex color to RGBA string"""
-        hex_color = hex_color.lstrip('#')
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        return f"({r}, {g}, {b}, {alpha})"
-    
     def acknowledge_single_carrier(self, carrier):
         """Acknowledge a single carrier"""
         if self.parent_display and hasattr(self.parent_display, 'acknowledge_single_carrier'):
@@ -365,11 +982,37 @@ class StatusCard(QFrame):
         """Update card status based on manifest states"""
         if not self.manifests:
             return
-            
-        acknowledged_count = sum(1 for _, status in self.manifests if status in ["Acknowledged", "AcknowledgedLate"])
-        missed_count = sum(1 for _, status in self.manifests if status == "Missed")
-        active_count = sum(1 for _, status in self.manifests if status == "Active")
-        total_count = len(self.manifests)
+        
+        # Count carrier states in a single pass
+        acknowledged_count = missed_count = active_count = 0
+        for _, status in self.manifests:
+            if status == "Acknowledged" or status == "AcknowledgedLate":
+                acknowledged_count += 1
+            elif status == "Missed":
+                missed_count += 1
+            elif status == "Active":
+                active_count += 1
+        counts = (acknowledged_count, missed_count, active_count, len(self.manifests))
+        
+        # Same counts means same card status - nothing to restyle
+        if counts == self._last_counts:
+            return
+        self._last_counts = counts
+        
+        # Already inside a batched update (e.g. update_manifest_display) - don't re-enable early
+        if not self.updatesEnabled():
+            self._apply_card_status(counts)
+            return
+        
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_card_status(counts)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _apply_card_status(self, counts):
+        """Set overall card status from carrier counts and restyle the header"""
+        acknowledged_count, missed_count, active_count, total_count = counts
         
         # Determine card status - no individual acknowledgment display here since we show per-carrier
         if acknowledged_count == total_count:
@@ -390,39 +1033,41 @@ class StatusCard(QFrame):
         self.time_status_label.setText(f"{self.time_str} - {display_status}")
         self.update_styling()
     
-    def get_acknowledgments_for_time_slot(self):
+    def get_acknowledgments_for_time_slot(self, acks=None):
         """Get acknowledgment info for all carriers in this time slot"""
-        if not self.parent_display:
+        if acks is None and not self.parent_display:
             return {}
             
         try:
-            acks = self.parent_display.load_acknowledgments()
+            if acks is None:
+                acks = self.parent_display.load_acknowledgments()
             today = datetime.now().date().isoformat()
             time_slot_acks = {}
             
             for carrier, status in self.manifests:
-                ack_key = f"{today}_{self.time_str}_{carrier}"
-                if ack_key in acks:
-                    time_slot_acks[carrier] = acks[ack_key]
+                ack_info = acks.get((today, self.time_str, carrier))
+                if ack_info is not None:
+                    time_slot_acks[carrier] = ack_info
                     
             return time_slot_acks
         except:
             return {}
 
-    def get_acknowledgment_info(self):
+    def get_acknowledgment_info(self, acks=None):
         """Get acknowledgment info for the first acknowledged item"""
-        if not self.parent_display:
+        if acks is None and not self.parent_display:
             return None
             
         try:
-            acks = self.parent_display.load_acknowledgments()
+            if acks is None:
+                acks = self.parent_display.load_acknowledgments()
             today = datetime.now().date().isoformat()
             
             for carrier, status in self.manifests:
                 if status in ["Acknowledged", "AcknowledgedLate"]:
-                    ack_key = f"{today}_{self.time_str}_{carrier}"
-                    if ack_key in acks:
-                        return acks[ack_key]
+                    ack_info = acks.get((today, self.time_str, carrier))
+                    if ack_info is not None:
+                        return ack_info
             return None
         except:
             return None
@@ -437,27 +1082,23 @@ class StatusCard(QFrame):
             self.setMaximumHeight(600)      # Allow even more height if needed
             
             # Make background transparent so red flash shows through
-            self.setStyleSheet("""
-                QFrame {
-                    background: transparent;
-                    border: 3px solid #3742fa;
-                    border-radius: 15px;
-                }
-            """)
+            self.update_styling()
             
             # Increase font sizes for better visibility
-            self.time_status_label.setFont(QFont("Segoe UI", 36, QFont.Weight.Bold))  # Larger header
+            self.time_status_label.setFont(_FONT_TIME_STATUS_MAXIMIZED)  # Larger header
             
             # Update carrier and acknowledgment label fonts
             for i in range(self.carriers_layout.count()):
                 widget = self.carriers_layout.itemAt(i).widget()
                 if widget and hasattr(widget, 'setFont'):
-                    widget.setFont(QFont("Segoe UI", 18, QFont.Weight.Normal))  # Larger carriers
+                    widget.setFont(_FONT_DETAILS_MAXIMIZED)  # Larger carriers
+                    _repolish(widget)  # Picks up the maximized outline
                     
             for i in range(self.ack_layout.count()):
                 widget = self.ack_layout.itemAt(i).widget()
                 if widget and hasattr(widget, 'setFont'):
-                    widget.setFont(QFont("Segoe UI", 18, QFont.Weight.Normal))  # Larger ack text
+                    widget.setFont(_FONT_DETAILS_MAXIMIZED)  # Larger ack text
+                    _repolish(widget)
                     
         else:
             # Normal mode: standard size and background
@@ -468,53 +1109,48 @@ class StatusCard(QFrame):
             self.update_styling()
             
             # Restore normal font sizes
-            self.time_status_label.setFont(QFont("Segoe UI", 28, QFont.Weight.Bold))  # Normal header
+            self.time_status_label.setFont(_FONT_TIME_STATUS)  # Normal header
             
             # Restore carrier and acknowledgment label fonts
             for i in range(self.carriers_layout.count()):
                 widget = self.carriers_layout.itemAt(i).widget()
                 if widget and hasattr(widget, 'setFont'):
-                    widget.setFont(QFont("Segoe UI", 14, QFont.Weight.Normal))  # Normal carriers
+                    widget.setFont(_FONT_DETAILS_NORMAL)  # Normal carriers
+                    _repolish(widget)
                     
             for i in range(self.ack_layout.count()):
                 widget = self.ack_layout.itemAt(i).widget()
                 if widget and hasattr(widget, 'setFont'):
-                    widget.setFont(QFont("Segoe UI", 14, QFont.Weight.Normal))  # Normal ack text
+                    widget.setFont(_FONT_DETAILS_NORMAL)  # Normal ack text
+                    _repolish(widget)
 
 
 class AlertDisplay(QWidget):
     def get_acknowledgments_path(self):
-        """Get path to acknowledgments file"""
+        """Get path to acknowledgments file (resolved once per settings save)"""
+        if self._acknowledgments_path:
+            return self._acknowledgments_path
         try:
             settings = self.load_settings()
             data_folder = settings.get('data_folder', '')
             
             if data_folder and os.path.exists(data_folder):
-                return os.path.join(data_folder, 'ack.json')
+                # Only cache the data folder path - a fallback is re-checked next call
+                # so a network share that comes back online is picked up
+                self._acknowledgments_path = os.path.join(data_folder, 'ack.json')
+                return self._acknowledgments_path
             
             # Fallback to app_data folder
             return os.path.join(os.path.dirname(__file__), 'app_data', 'ack.json')
         except Exception:
             return os.path.join(os.path.dirname(__file__), 'app_data', 'ack.json')
     
-    def load_settings(self):
-        """Load application settings"""
-        try:
-            settings_path = os.path.join(os.path.dirname(__file__), 'app_data', 'settings.json')
-            if os.path.exists(settings_path):
-                with open(settings_path, 'r') as f:
-                    return json.load(f)
-        except Exception:
-            pass
-        return {}
-
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Manifest Times")
         self.setMinimumSize(1200, 800)
         
         # Set window flags to ensure proper display behavior
-        from PyQt6.QtCore import Qt
         self.setWindowFlags(Qt.WindowType.Window)  # Ensure it's treated as a normal window
         
         # Alert state management
@@ -525,21 +1161,30 @@ class AlertDisplay(QWidget):
         self.previous_window_state = Qt.WindowState.WindowNoState
         
         # Set window icon
-        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', 'icon.ico')
-        if os.path.exists(icon_path):
-            window_icon = QIcon(icon_path)
-            if not window_icon.isNull():
-                self.setWindowIcon(window_icon)
+        window_icon = get_app_icon()
+        if not window_icon.isNull():
+            self.setWindowIcon(window_icon)
+        
+        self.status_cards = {}
+        
+        # Screen list is re-queried only when monitors are plugged/unplugged
+        self._screens_cache = None
+        self._screen_labels = None
+        self._watched_screens = set()  # Screens whose geometryChanged is connected
+        app = QGuiApplication.instance()
+        if app:
+            app.screenAdded.connect(self.invalidate_screens)
+            app.screenRemoved.connect(self.invalidate_screens)
         
-        self.status_cards = {}
         self.clock_timer = None
-        self.refresh_timer = None
-        self.flash_timer = None  # Timer for alarm background flashing
-        self.pause_timer = None  # Timer for pause between flash cycles
+        self.refresh_timer = None  # Status transitions - recomputes from cached data
+        self.reload_timer = None  # Periodic re-read of config/ack files
+        self.flash_timer = None  # Timer for alarm background flashing and the pauses between bursts
         self.tv_fullscreen_timer = None  # Timer for TV fullscreen mode
         self.flash_state = False  # Track flash on/off state
-        self.flash_cycle_count = 0  # Track number of flashes in current cycle
-        self.is_paused = False  # Track if we're in pause mode
+        self.flash_cycle_count = 0  # Flash timer ticks in the current burst
+        self.flash_interval = 0  # Toggle interval (ms) of the current burst
+        self._rng = random.Random()  # Flash/pause timing
         
         # Snooze functionality - now using centralized mute manager
         self.mute_manager = get_mute_manager()
@@ -553,11 +1198,34 @@ class AlertDisplay(QWidget):
         self._mute_check_interval = 30  # Only check network every 30 seconds
         self._fast_cache_duration = 5   # Use fast cache for 5 seconds between network calls
         
+        # Settings and resolved data paths - invalidated when settings are saved
+        app_dir = os.path.dirname(__file__)
+        self._settings_paths = (os.path.join(app_dir, 'app_data', 'settings.json'),
+                                os.path.join(app_dir, 'settings.json'))
+        self._settings_cache = None  # ((path, mtime_ns), settings, monotonic time last checked)
+        self._ack_path = None
+        self._acknowledgments_path = None
+        self._csv_folder = (None, None)  # (data folder, its csv subfolder)
+        self._csv_dir_verified = None  # (csv folder, monotonic time makedirs last succeeded)
+        self._csv_export = None  # CsvExportSignals of the export running on the thread pool
+        self._config_import = None  # (ConfigBackupSignals, csv path, data folder) while the pre-import backup runs
+        
         # Ultra-fast caching for network data
         self._cached_config = None
         self._cached_acks = None
+        self._ack_records = None  # ((path, mtime_ns, size), full ack list, index) used by the ack writers
+        self._ack_dirty = False  # In-memory ack list has entries not yet written
+        self._ack_prefetch = None  # AckLoadSignals of the ack.json load running on the thread pool
+        self._ack_flush_scheduled = False
+        self._ack_pending = []  # Ack entries added since the last successful ack.json write
+        self._ack_flush_failed = False  # Last flush failed - retrying without repeating the warning
+        self._ack_stamp = None  # (path, mtime_ns, date) the cached acks were parsed from
+        self._ack_formatted = {}  # (time_str, carrier) -> (user_name, " at HH:MM")
+        self._config_stamp = None  # (path, mtime_ns) the cached config was read from
+        self._last_fingerprint = None  # Inputs of the last full card rebuild
+        self._parsed_times = {}  # "HH:MM" -> (hour, minute) for the current config
+        self._sorted_manifests = []  # Manifests of the last rebuild, in time order
         self._config_cache_time = 0
-        self._acks_cache_time = 0
         self._data_cache_duration = 10  # Cache data for 10 seconds
         
         # Initialize sound effect
@@ -565,14 +1233,15 @@ class AlertDisplay(QWidget):
         
         self.setup_ui()
         self.setup_timers()
+        self.setStyleSheet(_MAIN_QSS)  # Set once - flashing toggles the flashOn property
         self.apply_background_style()  # Initialize background
         self.initialize_mute_status()  # Check mute status at startup
         self.populate_data()
+        self.prefetch_ack_records()
     
     @property
     def is_snoozed(self):
         """Check if system is currently muted with ultra-fast caching"""
-        import time
         current_time = time.time()
         
         # Ultra-fast response for frequent UI calls - use cache for 5 seconds
@@ -583,7 +1252,6 @@ class AlertDisplay(QWidget):
         if current_time - self._last_mute_check > self._mute_check_interval:
             try:
                 # Use a timeout for network calls to prevent hanging
-                import threading
                 result = [None]
                 
                 def check_network():
@@ -605,6 +1273,10 @@ class AlertDisplay(QWidget):
                     # Simple state change detection
                     if old_status != self._cached_mute_status:
                         print(f"🔔 Mute state changed: {old_status} → {self._cached_mute_status}")
+                        # Sound loops natively, so a mute from another PC has to stop it here
+                        if self._cached_mute_status and self.alert_sound:
+                            self.alert_sound.stop()
+                            self.alarm_sound_playing = False
                         # Update button without triggering more network calls
                         try:
                             self.update_snooze_button_icon()
@@ -653,7 +1325,7 @@ class AlertDisplay(QWidget):
         
         # Title
         title_label = QLabel("MANIFEST TIMES")
-        title_label.setFont(QFont("Segoe UI", 42, QFont.Weight.Bold))  # Increased from 36 to 42
+        title_label.setFont(_FONT_TITLE)
         title_label.setStyleSheet("color: #ffffff; padding: 0px;")  # Removed bottom padding
         header_layout.addWidget(title_label)
         
@@ -661,7 +1333,7 @@ class AlertDisplay(QWidget):
         
         # Multi-monitor button
         self.monitor_btn = QPushButton("🖥️")
-        self.monitor_btn.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        self.monitor_btn.setFont(_FONT_BUTTON)
         self.monitor_btn.setFixedSize(60, 40)
         self.monitor_btn.setStyleSheet("""
             QPushButton {
@@ -683,7 +1355,7 @@ class AlertDisplay(QWidget):
         
         # Fullscreen button
         self.fullscreen_btn = QPushButton("⛶")
-        self.fullscreen_btn.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        self.fullscreen_btn.setFont(_FONT_BUTTON)
         self.fullscreen_btn.setFixedSize(60, 40)
         self.fullscreen_btn.setStyleSheet("""
             QPushButton {
@@ -705,7 +1377,7 @@ class AlertDisplay(QWidget):
         
         # Settings button with cog icon
         self.settings_btn = QPushButton("⚙️")
-        self.settings_btn.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        self.settings_btn.setFont(_FONT_BUTTON)
         self.settings_btn.setFixedSize(60, 40)
         self.settings_btn.setStyleSheet("""
             QPushButton {
@@ -727,7 +1399,7 @@ class AlertDisplay(QWidget):
         
         # Snooze button (only visible during alerts)
         self.snooze_btn = QPushButton("🔊")
-        self.snooze_btn.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        self.snooze_btn.setFont(_FONT_BUTTON)
         self.snooze_btn.setFixedSize(60, 40)
         self.snooze_btn.setStyleSheet("""
             QPushButton {
@@ -750,7 +1422,7 @@ class AlertDisplay(QWidget):
         
         # Refresh Data button in header with refresh icon
         self.reload_btn = QPushButton("🔄")
-        self.reload_btn.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        self.reload_btn.setFont(_FONT_BUTTON)
         self.reload_btn.setFixedSize(60, 40)
         self.reload_btn.setStyleSheet("""
             QPushButton {
@@ -767,12 +1439,12 @@ class AlertDisplay(QWidget):
                 background-color: #1f2ecc;
             }
         """)
-        self.reload_btn.clicked.connect(self.populate_data)
+        self.reload_btn.clicked.connect(self.reload_data)
         header_layout.addWidget(self.reload_btn)
         
         # Clock - DS-Digital font for 7-segment display look
         self.clock_label = QLabel()
-        self.clock_label.setFont(QFont("DS-Digital", 42, QFont.Weight.Bold))  # Increased to match MANIFEST TIMES header
+        self.clock_label.setFont(_FONT_CLOCK)  # Matches MANIFEST TIMES header size
         self.clock_label.setStyleSheet("color: #FFD700; padding: 0px; margin-left: 20px; text-shadow: 0px 0px 5px #B8860B;")  # Golden yellow with subtle glow
         header_layout.addWidget(self.clock_label)
         
@@ -780,7 +1452,7 @@ class AlertDisplay(QWidget):
         
         # Status summary bar
         self.summary_label = QLabel("SYSTEM NOMINAL")
-        self.summary_label.setFont(QFont("Segoe UI", 22, QFont.Weight.Bold))  # Increased from 18 to 22
+        self.summary_label.setFont(_FONT_SUMMARY)
         self.summary_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.summary_label.setStyleSheet("""
             background-color: #2ed573;
@@ -814,7 +1486,7 @@ class AlertDisplay(QWidget):
         
         # Cards container
         cards_widget = QWidget()
-        self.cards_layout = QGridLayout(cards_widget)
+        self.cards_layout = QVBoxLayout(cards_widget)  # One card per row - no grid bookkeeping needed
         self.cards_layout.setSpacing(4)  # Reduced from 15 to 4 (about 75% reduction)
         self.cards_layout.setContentsMargins(10, 10, 10, 10)
         
@@ -836,7 +1508,8 @@ class AlertDisplay(QWidget):
                 self.alert_sound.setSource(QUrl.fromLocalFile(sound_path))
                 self.audio_output.setVolume(0.7)  # 70% volume
                 
-                # Set up looping - when playback finishes, restart if still in alarm mode
+                # Loop natively until stop_all_alarms/snooze stops it - no restart gap
+                self.alert_sound.setLoops(QMediaPlayer.Loops.Infinite)
                 self.alert_sound.mediaStatusChanged.connect(self.on_media_status_changed)
             else:
                 self.alert_sound = None
@@ -846,37 +1519,20 @@ class AlertDisplay(QWidget):
             self.audio_output = None
 
     def on_media_status_changed(self, status):
-        """Handle media status changes to implement looping during alarm mode"""
-        from PyQt6.QtMultimedia import QMediaPlayer
-        
-        # When playback ends, restart if we're still in alarm mode
-        if (status == QMediaPlayer.MediaStatus.EndOfMedia and 
-            getattr(self, 'alarm_sound_playing', False) and 
-            getattr(self, 'alert_active', False)):
-            # Wait 500ms before restarting to ensure clean playback (3-second file needs breathing room)
-            QTimer.singleShot(500, self.restart_alarm_audio)
-        elif status == QMediaPlayer.MediaStatus.InvalidMedia:
-            # Reset flag if media becomes invalid
+        """Reset the sound flag if the alarm media becomes invalid"""
+        
+        # Looping itself is native (setLoops) - only a broken source needs handling here
+        if status == QMediaPlayer.MediaStatus.InvalidMedia:
             self.alarm_sound_playing = False
 
-    def restart_alarm_audio(self):
-        """Restart alarm audio if still in alarm mode"""
-        if (getattr(self, 'alarm_sound_playing', False) and 
-            getattr(self, 'alert_active', False) and
-            not self.is_snoozed and  # Don't restart if snoozed
-            self.alert_sound and
-            self.alert_sound.playbackState() != QMediaPlayer.PlaybackState.PlayingState):
-            # Stop and restart for cleaner playback
-            self.alert_sound.stop()
-            # Small delay to ensure stop completes
-            QTimer.singleShot(100, lambda: self.alert_sound.play() if self.alert_sound else None)
-
     def changeEvent(self, event):
         """Handle window state changes to update fullscreen icon"""
-        from PyQt6.QtCore import QEvent
         if event.type() == QEvent.Type.WindowStateChange:
-            # Update icon when window state changes (including external changes)
-            self.update_fullscreen_icon()
+            # Update icon only when the fullscreen bit flips (including external changes) -
+            # minimize/maximize/activation don't change it
+            fullscreen = Qt.WindowState.WindowFullScreen
+            if (event.oldState() & fullscreen) != (self.windowState() & fullscreen):
+                self.update_fullscreen_icon()
         super().changeEvent(event)
     
     def apply_dark_theme(self):
@@ -944,10 +1600,10 @@ class AlertDisplay(QWidget):
             self.clock_timer.stop()
         if hasattr(self, 'refresh_timer') and self.refresh_timer:
             self.refresh_timer.stop()
+        if hasattr(self, 'reload_timer') and self.reload_timer:
+            self.reload_timer.stop()
         if hasattr(self, 'flash_timer') and self.flash_timer:
             self.flash_timer.stop()
-        if hasattr(self, 'pause_timer') and self.pause_timer:
-            self.pause_timer.stop()
         if hasattr(self, 'tv_fullscreen_timer') and self.tv_fullscreen_timer:
             self.tv_fullscreen_timer.stop()
         if hasattr(self, 'snooze_timer') and self.snooze_timer:
@@ -958,26 +1614,33 @@ class AlertDisplay(QWidget):
         # Initialize alarm state tracking
         self.alarm_sound_playing = False  # Track if sound is currently playing
         
+        # Clock, refresh, flash and pause timers are precise - coarse timers may fire up to 5%
+        # early, giving double flashes and overlapping refreshes
+        
         # Clock timer
         self.clock_timer = QTimer(self)
+        self.clock_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.clock_timer.timeout.connect(self.update_clock)
         self.clock_timer.start(1000)
         
-        # Data refresh timer
+        # Data reload timer - picks up config/ack changes from other machines
+        self.reload_timer = QTimer(self)
+        self.reload_timer.timeout.connect(self.populate_data)
+        self.reload_timer.start(30000)  # 30 seconds - reduced frequency for better performance
+        
+        # Status refresh timer - fires at the next Active/Missed transition (see update_refresh_timer)
         self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self.populate_data)
-        self.refresh_timer.start(30000)  # 30 seconds - reduced frequency for better performance
+        self.refresh_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self.refresh_statuses)
         
-        # Flash timer for alarm background - SINGLE SHOT to prevent overlap
+        # Flash timer for alarm background - SINGLE SHOT, re-armed by each tick for the
+        # next toggle or for the pause before the next burst
         self.flash_timer = QTimer(self)
-        self.flash_timer.setSingleShot(False)  # Will be managed manually
+        self.flash_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.flash_timer.setSingleShot(True)
         self.flash_timer.timeout.connect(self.toggle_flash)
         
-        # Pause timer for breaks between flash cycles - SINGLE SHOT
-        self.pause_timer = QTimer(self)
-        self.pause_timer.timeout.connect(self.resume_flashing)
-        self.pause_timer.setSingleShot(True)  # One-shot timer for pauses
-        
         # TV fullscreen timer - forces fullscreen every minute for TV displays
         self.tv_fullscreen_timer = QTimer(self)
         self.tv_fullscreen_timer.timeout.connect(self.force_tv_fullscreen)
@@ -1001,16 +1664,35 @@ class AlertDisplay(QWidget):
         if settings.get('keep_fullscreen_tv', False):
             self.start_tv_fullscreen_timer()
     
-    def update_refresh_timer(self):
-        """Update refresh timer interval based on alert state"""
+    def update_refresh_timer(self, now=None):
+        """Schedule the status refresh for the next status transition"""
         if self.refresh_timer:
-            # Always use 10 seconds - no need for 1-second updates during alerts
-            # This prevents excessive data refreshing that can cause window flashing
-            self.refresh_timer.start(30000)  # 30 seconds - reduced frequency for better performance
+            # Statuses only change at -2min (Active) and +30min (Missed) around each manifest,
+            # so fire just after the next boundary instead of polling through it
+            next_transition = self.seconds_until_next_transition(now or datetime.now())
+            if next_transition is not None:
+                self.refresh_timer.start(max(1000, int(next_transition * 1000) + 50))
+            else:
+                self.refresh_timer.stop()  # Nothing left today - reload_timer covers midnight
+    
+    def refresh_statuses(self):
+        """Recompute time-slot statuses from the cached config/acks without touching the disk"""
+        self.populate_data(reload_files=False)
+    
+    def seconds_until_next_transition(self, now):
+        """Seconds until the next Active/Missed boundary of today's manifests, or None"""
+        next_transition = None
+        for hour, minute in self._parsed_times.values():
+            manifest_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            for boundary in (manifest_time - timedelta(minutes=2), manifest_time + timedelta(minutes=30)):
+                remaining = (boundary - now).total_seconds()
+                if remaining > 0 and (next_transition is None or remaining < next_transition):
+                    next_transition = remaining
+        return next_transition
     
     def update_flash_timer(self):
         """Start or stop flash timer based on alert state with single alarm instance"""
-        if self.flash_timer and self.pause_timer:
+        if self.flash_timer:
             if self.alert_active:
                 # Always ensure alarm is on correct monitor when alert is active
                 # This handles both initial activation and settings changes during alerts
@@ -1019,15 +1701,9 @@ class AlertDisplay(QWidget):
                 # Stop TV fullscreen timer during active alerts to prevent conflicts
                 self.stop_tv_fullscreen_timer()
                 
-                # Only start flash timer if not already running
-                if not self.flash_timer.isActive() and not self.pause_timer.isActive():
-                    # Start the flash cycle with 3 red flashes
-                    self.flash_cycle_count = 0
-                    self.is_paused = False
-                    # Faster random flash speed between 2-10 Hz (100ms to 500ms) for more intense alarm
-                    import random
-                    flash_interval = random.randint(100, 500)  # 10Hz to 2Hz
-                    self.flash_timer.start(flash_interval)
+                # Only start flashing if a burst or pause isn't already scheduled
+                if not self.flash_timer.isActive():
+                    self.start_flash_burst()
                 
                 # Start continuous alarm sound when alarm starts - improved protection
                 if (self.alert_sound and 
@@ -1035,7 +1711,7 @@ class AlertDisplay(QWidget):
                     not self._cached_mute_status and  # Use cached status instead of is_snoozed property
                     self.alert_sound.playbackState() != QMediaPlayer.PlaybackState.PlayingState):
                     self.alarm_sound_playing = True
-                    self.alert_sound.play()  # Will loop automatically via media status handler
+                    self.alert_sound.play()  # Loops until stopped (setLoops)
                 
                 # Show snooze button during alerts
                 self.snooze_btn.setVisible(True)
@@ -1056,19 +1732,16 @@ class AlertDisplay(QWidget):
     
     def stop_all_alarms(self):
         """Stop all alarm timers and reset state"""
-        # Stop all timers
-        if self.flash_timer and self.flash_timer.isActive():
+        # Stop all timers (stop() is a no-op on an inactive timer - no isActive() round trip)
+        if self.flash_timer:
             self.flash_timer.stop()
-        if self.pause_timer and self.pause_timer.isActive():
-            self.pause_timer.stop()
-        if self.snooze_timer and self.snooze_timer.isActive():
+        if self.snooze_timer:
             self.snooze_timer.stop()
-        if self.snooze_countdown_timer and self.snooze_countdown_timer.isActive():
+        if self.snooze_countdown_timer:
             self.snooze_countdown_timer.stop()
             
         # Reset all alarm state
         self.flash_state = False
-        self.is_paused = False
         self.alarm_sound_playing = False
         # Note: Mute state is now handled by centralized mute manager
         self.snooze_end_time = None  # Reset local snooze end time
@@ -1111,14 +1784,12 @@ class AlertDisplay(QWidget):
         
         try:
             # Get current user name
-            import os
             current_user = os.getenv('USERNAME', 'Unknown')
             
             # Check current state quickly
             was_muted = self._cached_mute_status
             
             # Do mute toggle with timeout protection
-            import threading
             result = [None, None]  # [new_state, message]
             
             def do_toggle():
@@ -1146,7 +1817,6 @@ class AlertDisplay(QWidget):
                 self.alarm_sound_playing = False
                 
                 # Set local snooze end time for UI countdown
-                from datetime import datetime, timedelta
                 self.snooze_end_time = datetime.now() + timedelta(minutes=5)
                 
                 # Start countdown timer for UI
@@ -1190,6 +1860,7 @@ class AlertDisplay(QWidget):
                 self.alert_sound.play()
             
             self.update_snooze_button_icon()
+            self._last_fingerprint = None  # Summary still shows the countdown - force a redraw
             self.populate_data()  # Refresh to update summary without countdown
     
     def update_snooze_countdown(self):
@@ -1201,7 +1872,6 @@ class AlertDisplay(QWidget):
                     self.snooze_countdown_timer.stop()
                 return
             
-            from datetime import datetime
             now = datetime.now()
             
             if now >= self.snooze_end_time:
@@ -1258,38 +1928,38 @@ class AlertDisplay(QWidget):
         # Use cached status only - don't trigger network calls during UI updates
         if self._cached_mute_status:
             self.snooze_btn.setText("🔇")  # Muted speaker icon
-            self.snooze_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #ff4757;
-                    color: #ffffff;
-                    border: 2px solid #ff4757;
-                    border-radius: 20px;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #ff3838;
-                }
-                QPushButton:pressed {
-                    background-color: #e84118;
-                }
-            """)
+            self.snooze_btn.setStyleSheet(_SNOOZE_MUTED_QSS)
         else:
             self.snooze_btn.setText("🔊")  # Normal speaker icon
-            self.snooze_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #2c2c54;
-                    color: #ffffff;
-                    border: 2px solid #3742fa;
-                    border-radius: 20px;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #3742fa;
-                }
-                QPushButton:pressed {
-                    background-color: #1f2ecc;
-                }
-            """)
+            self.snooze_btn.setStyleSheet(_SNOOZE_UNMUTED_QSS)
+    
+    def get_screens(self):
+        """Connected screens - cached until a screen is added or removed"""
+        if self._screens_cache is None:
+            self._screens_cache = QGuiApplication.screens()
+        return self._screens_cache
+    
+    def get_screen_labels(self):
+        """'Name (WxH)' label per connected screen for the monitor combo and menu - cached with the screen list"""
+        if self._screen_labels is None or self._screens_cache is None:
+            labels = []
+            for i, screen in enumerate(self.get_screens()):
+                geometry = screen.geometry()
+                # Get the actual monitor name/manufacturer if available
+                name = screen.name() or f"Monitor {i+1}"
+                labels.append(f"{name} ({geometry.width()}x{geometry.height()})")
+                
+                # Resolution changes don't add or remove screens - watch each screen once
+                if screen not in self._watched_screens:
+                    self._watched_screens.add(screen)
+                    screen.geometryChanged.connect(self.invalidate_screens)
+            self._screen_labels = labels
+        return self._screen_labels
+    
+    def invalidate_screens(self, screen=None):
+        """screenAdded/screenRemoved/geometryChanged handler - re-query screens on next use"""
+        self._screens_cache = None
+        self._screen_labels = None
     
     def ensure_alarm_on_correct_monitor(self):
         """Ensure alarm is displayed fullscreen on the correct monitor - simplified approach"""
@@ -1299,8 +1969,7 @@ class AlertDisplay(QWidget):
             target_monitor = settings.get('alarm_monitor', 0)
             
             # Get available screens
-            from PyQt6.QtGui import QGuiApplication
-            screens = QGuiApplication.screens()
+            screens = self.get_screens()
             
             # Validate target monitor
             if target_monitor >= len(screens):
@@ -1317,10 +1986,7 @@ class AlertDisplay(QWidget):
                     return  # Already on correct monitor
             
             # Need to move to correct monitor
-            try:
-                print(f"DEBUG: Moving alarm to monitor {target_monitor}")
-            except:
-                pass  # Ignore console output errors
+            log.debug("Moving alarm to monitor %s", target_monitor)
             
             # Exit fullscreen for repositioning
             if self.isFullScreen():
@@ -1343,15 +2009,11 @@ class AlertDisplay(QWidget):
                 
                 self.move(new_x, new_y)
             
-            # Go fullscreen with a small delay
-            from PyQt6.QtCore import QTimer
-            QTimer.singleShot(100, self.showFullScreen)
+            # Go fullscreen once the queued move/show events have been processed
+            QMetaObject.invokeMethod(self, "showFullScreen", Qt.ConnectionType.QueuedConnection)
             
         except Exception as e:
-            try:
-                print(f"DEBUG: Error in ensure_alarm_on_correct_monitor: {e}")
-            except:
-                pass  # Ignore console output errors
+            log.debug("Error in ensure_alarm_on_correct_monitor: %s", e)
     
     def force_tv_fullscreen(self):
         """Force the display to fullscreen (for TV mode) - improved logic"""
@@ -1407,7 +2069,6 @@ class AlertDisplay(QWidget):
         
         # Additional Windows-specific activation
         try:
-            import os
             if os.name == 'nt':  # Windows
                 import ctypes
                 hwnd = int(self.winId())
@@ -1416,116 +2077,60 @@ class AlertDisplay(QWidget):
             pass
 
     def toggle_flash(self):
-        """Toggle flash state with 3 red flashes then random pause"""
-        if self.is_paused:
-            return
-            
-        self.flash_state = not self.flash_state
-        
-        # Count flashes (only count "on" states)
-        if self.flash_state:
-            self.flash_cycle_count += 1
-            
-            # After 3 red flashes, start random pause (3-10 seconds)
-            if self.flash_cycle_count >= 3:
-                self.flash_timer.stop()
-                self.is_paused = True
-                self.flash_state = False  # Ensure background goes to normal during pause
-                self.apply_background_style()
-                
-                # Random pause between 3-10 seconds
-                import random
-                pause_duration = random.randint(3000, 10000)  # 3-10 seconds in milliseconds
-                self.pause_timer.start(pause_duration)
-                return
-        
-        self.apply_background_style()
+        """Flash timer tick - red/black toggles, then a random pause on the same timer"""
+        self.flash_cycle_count += 1
+        if self.flash_cycle_count < 5:
+            # Ticks 1-4 alternate red/black at this burst's speed
+            self.flash_state = not self.flash_state
+            self.apply_background_style()
+            self.flash_timer.start(self.flash_interval)
+        else:
+            # Burst done - stay black for a random 3-10 s, then flash again at a new speed
+            self.flash_state = False
+            self.apply_background_style()
+            self.start_flash_burst(self._rng.randint(3000, 10000))
+    
+    def start_flash_burst(self, delay=0):
+        """Arm the flash timer for a new burst at a new random speed after delay ms"""
+        self.flash_cycle_count = 0
+        self.flash_state = False
+        # Random flash speed between 2-4 Hz (250ms to 500ms by default)
+        self.flash_interval = self.random_flash_interval()
+        self.flash_timer.start(delay + self.flash_interval)
     
-    def resume_flashing(self):
-        """Resume flashing after random pause with new random speed"""
-        # Only resume if alert is still active and we're not already flashing
-        if self.alert_active and not self.flash_timer.isActive():
-            self.flash_cycle_count = 0
-            self.is_paused = False
-            # New faster random flash speed for next cycle (2-10 Hz)
-            import random
-            flash_interval = random.randint(100, 500)  # 10Hz to 2Hz
-            self.flash_timer.start(flash_interval)
+    def random_flash_interval(self):
+        """Random flash interval in ms, no faster than the min_flash_interval_ms setting"""
+        # Faster than ~4 Hz looks no different on screen but restyles the window twice as often
+        try:
+            min_interval = int(self.load_settings().get('min_flash_interval_ms', 250))
+        except (TypeError, ValueError):
+            min_interval = 250
+        min_interval = max(100, min(500, min_interval))
+        return self._rng.randint(min_interval, 500)  # 4Hz to 2Hz by default
     
     def apply_background_style(self):
         """Apply background style with pure black default and pure red flash"""
-        if self.alert_active and self.flash_state and not self.is_paused:
-            # Pure red flash
-            bg_color = "#FF0000"
-        else:
-            # Pure black background
-            bg_color = "#000000"
-            
-        # Apply to main widget - use more specific selectors to avoid interfering with window controls
-        self.setStyleSheet(f"""
-            AlertDisplay {{
-                background-color: {bg_color};
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }}
-            QLabel {{
-                background: transparent;
-                color: inherit;
-            }}
-            QPushButton {{
-                background-color: #3742fa;
-                color: #ffffff;
-                border: none;
-                border-radius: 8px;
-                padding: 15px 30px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #4f69ff;
-            }}
-            QPushButton:pressed {{
-                background-color: #2c35e6;
-            }}
-            QFrame {{
-                background-color: {bg_color};
-                color: #ffffff;
-            }}
-            QScrollArea {{
-                background-color: {bg_color};
-                color: #ffffff;
-            }}
-            QMessageBox {{
-                background-color: #1a1a2e;
-                color: #ffffff;
-                font-size: 16px;
-            }}
-            QMessageBox QLabel {{
-                color: #ffffff;
-                font-size: 16px;
-            }}
-            QMessageBox QPushButton {{
-                background-color: #3742fa;
-                color: #ffffff;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 80px;
-            }}
-            QMessageBox QPushButton:hover {{
-                background-color: #4f69ff;
-            }}
-        """)
+        flash_on = "true" if (self.alert_active and self.flash_state) else "false"
+        if self.property("flashOn") == flash_on:
+            return
+        
+        # Property selectors in _MAIN_QSS pick the colour - no stylesheet re-parse per flash.
+        # Only the window and its direct frames (title, clock, scroll area) take the flash
+        # colour; the cards' own sheets keep their contents transparent
+        self.setProperty("flashOn", flash_on)
+        style = self.style()
+        for widget in [self] + self.findChildren(QFrame, options=Qt.FindChildOption.FindDirectChildrenOnly):
+            style.unpolish(widget)
+            style.polish(widget)
+            widget.update()
     
     def update_clock(self):
         """Update the clock display"""
         now = datetime.now()
-        self.clock_label.setText(now.strftime('%H:%M'))
+        self.clock_label.setText(f"{now.hour:02d}:{now.minute:02d}")
     
     def load_config(self):
-        """Load configuration with aggressive caching to avoid network delays"""
-        import time
+        """Load configuration with aggressive caching - config.json is only re-parsed when its mtime changes"""
         current_time = time.time()
         
         # Return cached config if still valid
@@ -1535,8 +2140,19 @@ class AlertDisplay(QWidget):
         
         # Load config with timeout protection
         try:
-            import threading
-            result = [None]
+            result = [None, None]  # [config, (path, mtime_ns)]
+            
+            def read_config(config_path):
+                stamp = (config_path, os.stat(config_path).st_mtime_ns)
+                cached = self._cached_config
+                if cached and stamp == self._config_stamp:
+                    # Unchanged since the last read - a stat instead of re-parsing the JSON
+                    result[0], result[1] = cached, stamp
+                    return
+                # One bulk read of the bytes, parsed by orjson when available
+                with open(config_path, 'rb') as f:
+                    result[0] = _load_json(f)
+                result[1] = stamp
             
             def load_config_network():
                 try:
@@ -1547,17 +2163,15 @@ class AlertDisplay(QWidget):
                     if data_folder and os.path.exists(data_folder):
                         config_path = os.path.join(data_folder, 'config.json')
                         if os.path.exists(config_path):
-                            with open(config_path, 'r', encoding='utf-8') as f:
-                                result[0] = json.load(f)
-                                return
+                            read_config(config_path)
+                            return
                     
                     # Fallback to default locations
                     for folder in ['data', 'app_data', '.']:
                         config_path = os.path.join(os.path.dirname(__file__), folder, 'config.json')
                         if os.path.exists(config_path):
-                            with open(config_path, 'r', encoding='utf-8') as f:
-                                result[0] = json.load(f)
-                                return
+                            read_config(config_path)
+                            return
                     
                     # Import fallback
                     from data_manager import load_config
@@ -1572,6 +2186,7 @@ class AlertDisplay(QWidget):
             
             if result[0]:
                 self._cached_config = result[0]
+                self._config_stamp = result[1]
                 self._config_cache_time = current_time
                 return self._cached_config
                 
@@ -1585,65 +2200,145 @@ class AlertDisplay(QWidget):
         # Ultimate fallback
         return {"manifests": []}
     
-    def populate_data(self):
-        """Populate cards with manifest data"""
-        # Clear existing cards
-        for card in self.status_cards.values():
-            card.setParent(None)
-        self.status_cards.clear()
+    def remove_stale_widgets(self, widgets):
+        """Delete cards/labels that were taken out of the cards layout and not re-added"""
+        for widget in widgets:
+            widget.hide()
+            # Deferred - a stale card may be the one whose click triggered this refresh
+            widget.deleteLater()
+    
+    def invalidate_data_cache(self):
+        """Drop cached config/acks so the next populate_data re-reads and rebuilds everything"""
+        self._config_cache_time = 0
+        self._config_stamp = None
+        self._ack_stamp = None
+        self._last_fingerprint = None
+    
+    def reload_data(self):
+        """Reload button handler - always performs a full refresh"""
+        self.invalidate_data_cache()
+        self.populate_data()
+    
+    def current_slot_statuses(self, now):
+        """Status of every parsed time slot - only changes at the -2/+30 minute boundaries"""
+        return tuple(get_manifest_status(hm, now) for hm in self._parsed_times.values())
+    
+    def populate_data(self, reload_files=True):
+        """Populate cards with manifest data (reload_files=False reuses the last loaded files)"""
+        if reload_files or self._cached_config is None:
+            # Load configuration and acknowledgments (both cached)
+            config = self.load_config()
+            acks = self.load_acknowledgments()
+        else:
+            config = self._cached_config
+            acks = self._cached_acks if self._cached_acks is not None else {}
+        now = datetime.now()
+        
+        # If the files and mute state are unchanged and no time slot has crossed a status
+        # boundary since the last rebuild, the cards are already correct
+        fingerprint = (self._config_stamp, self._ack_stamp, self._cached_mute_status,
+                       self.current_slot_statuses(now))
+        if self._config_stamp is not None and fingerprint == self._last_fingerprint:
+            self.update_clock()
+            if not self.alert_active:
+                # Only the "next manifest in" countdown moves between transitions
+                next_manifest_info = self.get_next_manifest_info(self._sorted_manifests, now)
+                if next_manifest_info and next_manifest_info != self.summary_label.text():
+                    self.update_summary(next_manifest_info, "#3742fa")
+            self.update_refresh_timer(now)
+            if self.alert_active:
+                # Keep enforcing alarm window/sound as a full refresh would
+                self.update_flash_timer()
+            return
+        self._last_fingerprint = fingerprint
+        
+        # Rebuild with window repaints and cards layout suspended - one layout pass and one
+        # repaint per rebuild instead of one per added card / restyled label
+        self.setUpdatesEnabled(False)
+        self.cards_layout.setEnabled(False)
+        try:
+            self.rebuild_display(config, acks, now, fingerprint)
+        finally:
+            self.cards_layout.setEnabled(True)
+            self.cards_layout.activate()
+            self.setUpdatesEnabled(True)
+    
+    def rebuild_display(self, config, acks, now, fingerprint):
+        """Recreate card contents and summary from config/acks (caller batches repaints)"""
+        # Empty the cards layout but keep the cards - any still configured are reused and re-added
+        # below in time order; whatever is left over (stale cards, "no data" label) is deleted
+        leftover = []
+        while self.cards_layout.count():
+            item = self.cards_layout.takeAt(0)
+            if item.widget() is not None:
+                leftover.append(item.widget())
+        previous_cards = self.status_cards
+        self.status_cards = {}
         
-        # Load configuration
-        config = self.load_config()
         manifests = config.get('manifests', [])
         
         if not manifests:
             # Show "no data" message
             no_data_label = QLabel("NO MANIFEST DATA AVAILABLE")
-            no_data_label.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
+            no_data_label.setFont(_FONT_NO_DATA)
             no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             no_data_label.setStyleSheet("color: #ff4757; padding: 100px;")
-            self.cards_layout.addWidget(no_data_label, 0, 0)
+            self.cards_layout.addWidget(no_data_label)
+            self.remove_stale_widgets(leftover)
+            self._parsed_times = {}
+            self._sorted_manifests = []
+            self._last_fingerprint = fingerprint[:3] + ((),)
             self.update_summary("NO DATA")
             return
         
         # Sort manifests by time
         manifests = sorted(manifests, key=lambda m: m['time'])
+        self._sorted_manifests = manifests
         
-        # Load acknowledgments
-        acks = self.load_acknowledgments()
+        # Parse each "HH:MM" once per rebuild instead of strptime per status/late check
+        self._parsed_times = {}
+        for manifest in manifests:
+            try:
+                self._parsed_times[manifest['time']] = parse_manifest_time(manifest['time'])
+            except (ValueError, AttributeError):
+                pass  # Left unparsed - get_manifest_status reports it as before
+        # Record statuses for the times just parsed so the next tick compares like with like
+        self._last_fingerprint = fingerprint[:3] + (self.current_slot_statuses(now),)
         
-        now = datetime.now()
         today = now.date().isoformat()
         
         # Create status cards - one per row
-        row = 0
-        cols_per_row = 1  # One card per row for wider layout
-        
         active_count = 0
         missed_count = 0
         open_count = 0
         acked_count = 0
         
+        # ids of the cards added to the layout this rebuild - two manifests can share a time,
+        # so status_cards (keyed by time) may not hold every card that is on screen
+        placed = set()
+        
         for manifest in manifests:
             time_str = manifest['time']
             
-            # Create status card with parent reference
-            card = StatusCard(time_str, parent_display=self)
+            # Reuse this time's card from the last rebuild, or create one with parent reference
+            card = previous_cards.pop(time_str, None)
+            if card is None:
+                card = StatusCard(time_str, parent_display=self)
             self.status_cards[time_str] = card
             
             # Process carriers for this time - determine overall time slot status first
             manifest_data = []
-            time_slot_status = get_manifest_status(time_str, now)
+            parsed_time = self._parsed_times.get(time_str)
+            time_slot_status = get_manifest_status(parsed_time or time_str, now)
             # Processing time slot for acknowledgment check
             
             for carrier in manifest.get('carriers', []):
-                ack_key = f"{today}_{time_str}_{carrier}"
-                is_acked = ack_key in acks
+                # Single tuple-key lookup - None when this carrier isn't acknowledged today
+                ack_info = acks.get((today, time_str, carrier))
                 # Check acknowledgment status for active/missed items
                 
-                if is_acked:
+                if ack_info is not None:
                     # Check if it was a late acknowledgment
-                    ack_info = acks[ack_key]
                     timestamp = ack_info.get('timestamp', '')
                     is_late = False
                     
@@ -1651,9 +2346,8 @@ class AlertDisplay(QWidget):
                         try:
                             # Parse timestamp and check if late (after 30 minutes)
                             ack_time = datetime.fromisoformat(timestamp)
-                            manifest_time = datetime.strptime(time_str, '%H:%M').replace(
-                                year=ack_time.year, month=ack_time.month, day=ack_time.day
-                            )
+                            hour, minute = parsed_time or parse_manifest_time(time_str)
+                            manifest_time = ack_time.replace(hour=hour, minute=minute, second=0, microsecond=0)
                             deadline = manifest_time + timedelta(minutes=30)
                             is_late = ack_time > deadline
                         except:
@@ -1682,11 +2376,13 @@ class AlertDisplay(QWidget):
                 
                 manifest_data.append((carrier, status))
             
-            card.set_manifests(manifest_data)
+            card.set_manifests(manifest_data, acks)
             
-            # Add to grid - one per row
-            self.cards_layout.addWidget(card, row, 0)
-            row += 1
+            # Append to the column - one per row
+            self.cards_layout.addWidget(card)
+            placed.add(id(card))
+        
+        self.remove_stale_widgets([w for w in leftover if id(w) not in placed])
         
         # Determine if single card scaling should be used
         # Single card mode: exactly one active alert and no missed alerts
@@ -1722,8 +2418,8 @@ class AlertDisplay(QWidget):
         # Update alert state
         self.alert_active = (active_count > 0 or missed_count > 0)
         
-        # Update refresh timer interval based on alert state
-        self.update_refresh_timer()
+        # Schedule next refresh around the next status transition
+        self.update_refresh_timer(now)
         
         # Update flash timer based on alert state
         self.update_flash_timer()
@@ -1733,8 +2429,7 @@ class AlertDisplay(QWidget):
         if active_count > 0:
             # Check if snoozed and show countdown
             if self.is_snoozed and self.snooze_end_time:
-                import datetime as dt
-                time_remaining = self.snooze_end_time - dt.datetime.now()
+                time_remaining = self.snooze_end_time - datetime.now()
                 total_seconds = int(time_remaining.total_seconds())
                 if total_seconds > 0:
                     minutes = total_seconds // 60
@@ -1750,18 +2445,19 @@ class AlertDisplay(QWidget):
             self.update_summary(next_manifest_info, "#3742fa")
         else:
             self.update_summary("ALL SYSTEMS NOMINAL", "#2ed573")
-    
+        
     def get_next_manifest_info(self, manifests, now):
         """Get countdown to next manifest"""
         try:
-            current_time = now.time()
+            # (hour, minute) tuples compare like times - parsed once per rebuild in _parsed_times
+            current_time = (now.hour, now.minute, now.second, now.microsecond)
             next_manifest = None
             
             for manifest in manifests:
-                manifest_time = datetime.strptime(manifest['time'], '%H:%M').time()
+                hour, minute = self._parsed_times.get(manifest['time']) or parse_manifest_time(manifest['time'])
                 
                 # Check if this manifest is in the future today
-                if manifest_time > current_time:
+                if (hour, minute, 0, 0) > current_time:
                     next_manifest = manifest
                     break
             
@@ -1770,12 +2466,11 @@ class AlertDisplay(QWidget):
                 next_manifest = manifests[0]
                 # Calculate time to tomorrow's first manifest
                 tomorrow = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
-                manifest_time = datetime.strptime(next_manifest['time'], '%H:%M').time()
-                next_time = tomorrow.replace(hour=manifest_time.hour, minute=manifest_time.minute)
+                hour, minute = self._parsed_times.get(next_manifest['time']) or parse_manifest_time(next_manifest['time'])
+                next_time = tomorrow.replace(hour=hour, minute=minute)
             else:
                 # Calculate time to today's next manifest
-                manifest_time = datetime.strptime(next_manifest['time'], '%H:%M').time()
-                next_time = now.replace(hour=manifest_time.hour, minute=manifest_time.minute, second=0, microsecond=0)
+                next_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
             
             # Calculate time difference
             time_diff = next_time - now
@@ -1806,55 +2501,59 @@ class AlertDisplay(QWidget):
         """)
     
     def get_ack_path(self):
-        """Get the correct path for ack.json using settings"""
+        """Get the correct path for ack.json using settings (resolved once per settings save)"""
+        if self._ack_path:
+            return self._ack_path
+        
         settings = self.load_settings()
         data_folder = settings.get('data_folder', '')
         
         if data_folder and os.path.exists(data_folder):
-            return os.path.join(data_folder, 'ack.json')
+            # Only cache the data folder path - a fallback is re-checked next call
+            self._ack_path = os.path.join(data_folder, 'ack.json')
+            return self._ack_path
         else:
             # This should not happen if settings are configured correctly
             print(f"WARNING: data_folder '{data_folder}' not found, this may cause sync issues")
             return os.path.join(os.path.dirname(__file__), 'ack.json')
     
     def load_acknowledgments(self):
-        """Load acknowledgment data with aggressive caching to avoid network delays"""
-        import time
-        current_time = time.time()
-        
-        # Return cached acks if still valid
-        if (self._cached_acks and 
-            current_time - self._acks_cache_time < self._data_cache_duration):
-            return self._cached_acks
-        
+        """Load acknowledgment data, re-parsing ack.json only when its mtime changes"""
         # Load acks with timeout protection
         try:
-            import threading
             result = [None]
             
             def load_acks_network():
                 try:
                     ack_path = self.get_ack_path()
+                    today = datetime.now().date().isoformat()
+                    
+                    try:
+                        mtime = os.stat(ack_path).st_mtime_ns
+                    except OSError:
+                        result[0] = ({}, None)
+                        return
                     
-                    if not os.path.exists(ack_path):
-                        result[0] = {}
+                    # Unchanged file (and same day) - reuse the parsed lookup dict
+                    stamp = (ack_path, mtime, today)
+                    if self._cached_acks is not None and stamp == self._ack_stamp:
+                        result[0] = (self._cached_acks, stamp)
                         return
                     
-                    with open(ack_path, 'r', encoding='utf-8') as f:
-                        ack_data = json.load(f)
+                    with open(ack_path, 'rb') as f:
+                        ack_data = _load_json(f)
                     
-                    # Convert to lookup dict
+                    # Convert to lookup dict keyed by (date, manifest_time, carrier)
                     acks = {}
-                    today = datetime.now().date().isoformat()
                     
                     for ack in ack_data:
                         if ack.get('date') == today:
-                            key = f"{ack['date']}_{ack['manifest_time']}_{ack['carrier']}"
+                            key = (ack['date'], ack['manifest_time'], ack['carrier'])
                             acks[key] = ack
                     
-                    result[0] = acks
+                    result[0] = (acks, stamp)
                 except:
-                    result[0] = {}
+                    result[0] = ({}, None)
             
             thread = threading.Thread(target=load_acks_network)
             thread.daemon = True
@@ -1862,8 +2561,11 @@ class AlertDisplay(QWidget):
             thread.join(1.0)  # 1 second timeout
             
             if result[0] is not None:
-                self._cached_acks = result[0]
-                self._acks_cache_time = current_time
+                acks, self._ack_stamp = result[0]
+                if acks is not self._cached_acks:
+                    # Ack file re-parsed - preformatted display strings are stale
+                    self._ack_formatted.clear()
+                self._cached_acks = acks
                 return self._cached_acks
                 
         except Exception:
@@ -1876,65 +2578,20 @@ class AlertDisplay(QWidget):
         # Ultimate fallback
         return {}
     
+    def get_ack_display(self, time_str, carrier, ack_info):
+        """Preformatted (user_name, " at HH:MM") for today's ack, parsed once per ack file version"""
+        key = (time_str, carrier)
+        formatted = self._ack_formatted.get(key)
+        if formatted is None:
+            formatted = self._ack_formatted[key] = format_ack_display(ack_info)
+        return formatted
+    
     def show_settings_dialog(self):
         """Show settings configuration dialog with CSV export/import functionality"""
         dialog = QDialog(self)
         dialog.setWindowTitle("Settings")
         dialog.setFixedSize(600, 550)  # Increased size for monitor selection
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #1a1a2e;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-                font-size: 14px;
-            }
-            QLineEdit {
-                background-color: #2c2c54;
-                border: 2px solid #3742fa;
-                border-radius: 5px;
-                padding: 8px;
-                color: #ffffff;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border-color: #4f69ff;
-            }
-            QLineEdit.error {
-                border-color: #ff4757;
-                background-color: #3d1a1a;
-            }
-            QPushButton {
-                background-color: #3742fa;
-                color: #ffffff;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: bold;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #4f69ff;
-            }
-            QPushButton:disabled {
-                background-color: #555555;
-                color: #999999;
-            }
-            .status-label {
-                font-size: 12px;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            .status-valid {
-                color: #2ed573;
-                background-color: #1b2d1b;
-            }
-            .status-invalid {
-                color: #ff4757;
-                background-color: #3d1a1a;
-            }
-        """)
+        dialog.setStyleSheet(_SETTINGS_DIALOG_QSS)
         
         layout = QVBoxLayout()
         form_layout = QFormLayout()
@@ -1959,7 +2616,13 @@ class AlertDisplay(QWidget):
         folder_value = current_settings.get('data_folder', '')
         self.folder_edit.setText(folder_value)
         self.folder_edit.setPlaceholderText("Enter folder path for JSON files...")
-        self.folder_edit.textChanged.connect(self.validate_folder_path)
+        
+        # Probe the disk 250 ms after the last keystroke rather than on every character
+        self._folder_probe_cache = {}  # folder path -> probe_folder() result while this dialog is open
+        self._folder_validate_timer = QTimer(dialog)
+        self._folder_validate_timer.setSingleShot(True)
+        self._folder_validate_timer.timeout.connect(lambda: self.validate_folder_path(use_cache=True))
+        self.folder_edit.textChanged.connect(self.schedule_folder_validation)
         
         # Status label for folder validation
         self.folder_status_label = QLabel("")
@@ -1977,83 +2640,34 @@ class AlertDisplay(QWidget):
         monitor_layout.setSpacing(5)
         
         self.monitor_combo = QComboBox()
-        self.monitor_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #2c2c54;
-                border: 2px solid #3742fa;
-                border-radius: 5px;
-                padding: 8px;
-                color: #ffffff;
-                font-size: 14px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #ffffff;
-            }d
-        """)
+        self.monitor_combo.setStyleSheet(_MONITOR_COMBO_QSS)
         
         # Populate monitor list
-        from PyQt6.QtGui import QGuiApplication
-        screens = QGuiApplication.screens()
-        for i, screen in enumerate(screens):
-            geometry = screen.geometry()
-            # Get the actual monitor name/manufacturer if available
-            monitor_name = screen.name() if hasattr(screen, 'name') and screen.name() else f"Monitor {i+1}"
-            # Create descriptive label with monitor name and resolution
-            label = f"{monitor_name} ({geometry.width()}x{geometry.height()})"
+        for i, label in enumerate(self.get_screen_labels()):
             self.monitor_combo.addItem(label, i)
         
         # Set current selection
         current_monitor = current_settings.get('alarm_monitor', 0)
         if current_monitor < self.monitor_combo.count():
-            self.monitor_combo.setCurrentIndex(current_monitor)
-        
-        monitor_layout.addWidget(self.monitor_combo)
-        
-        # Monitor help text
-        monitor_help = QLabel("Monitor where fullscreen alarm will appear")
-        monitor_help.setStyleSheet("color: #888888; font-size: 12px;")
-        monitor_layout.addWidget(monitor_help)
-        
-        form_layout.addRow("Alarm Monitor:", monitor_widget)
-        
-        # TV Display Checkbox
-        tv_widget = QWidget()
-        tv_layout = QVBoxLayout(tv_widget)
-        tv_layout.setContentsMargins(0, 0, 0, 0)
-        tv_layout.setSpacing(5)
-        
-        from PyQt6.QtWidgets import QCheckBox
-        self.tv_checkbox = QCheckBox("Keep Full Screen for TV")
-        self.tv_checkbox.setStyleSheet("""
-            QCheckBox {
-                color: #ffffff;
-                font-size: 14px;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #3742fa;
-                border-radius: 4px;
-                background-color: #2c2c54;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #3742fa;
-                border-color: #4f69ff;
-            }
-            QCheckBox::indicator:checked::after {
-                content: "✓";
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-            }
-        """)
+            self.monitor_combo.setCurrentIndex(current_monitor)
+        
+        monitor_layout.addWidget(self.monitor_combo)
+        
+        # Monitor help text
+        monitor_help = QLabel("Monitor where fullscreen alarm will appear")
+        monitor_help.setStyleSheet("color: #888888; font-size: 12px;")
+        monitor_layout.addWidget(monitor_help)
+        
+        form_layout.addRow("Alarm Monitor:", monitor_widget)
+        
+        # TV Display Checkbox
+        tv_widget = QWidget()
+        tv_layout = QVBoxLayout(tv_widget)
+        tv_layout.setContentsMargins(0, 0, 0, 0)
+        tv_layout.setSpacing(5)
+        
+        self.tv_checkbox = QCheckBox("Keep Full Screen for TV")
+        self.tv_checkbox.setStyleSheet(_TV_CHECKBOX_QSS)
         
         # Set current selection
         current_tv_mode = current_settings.get('keep_fullscreen_tv', False)
@@ -2071,19 +2685,12 @@ class AlertDisplay(QWidget):
         
         # CSV Operations Section
         csv_group = QWidget()
-        csv_group.setStyleSheet("""
-            QWidget {
-                background-color: #2c2c54;
-                border: 1px solid #3742fa;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
+        csv_group.setStyleSheet(_CSV_GROUP_QSS)
         csv_layout = QVBoxLayout(csv_group)
         csv_layout.setContentsMargins(15, 15, 15, 15)
         
         csv_title = QLabel("CSV Operations:")
-        csv_title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        csv_title.setFont(_FONT_SECTION_TITLE)
         csv_title.setStyleSheet("background: transparent; border: none; color: #ffffff;")
         csv_layout.addWidget(csv_title)
         
@@ -2092,89 +2699,25 @@ class AlertDisplay(QWidget):
         
         # Export Acknowledgments button
         self.export_ack_btn = QPushButton("Export Ack")
-        self.export_ack_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: #ffffff;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 16px;
-                font-weight: bold;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #2ecc71;
-            }
-            QPushButton:pressed {
-                background-color: #1e8449;
-            }
-        """)
+        self.export_ack_btn.setStyleSheet(_EXPORT_ACK_BTN_QSS)
         self.export_ack_btn.clicked.connect(self.export_to_csv_from_settings)
         csv_buttons_layout.addWidget(self.export_ack_btn)
         
         # Export Config button
         self.export_config_btn = QPushButton("Export Config")
-        self.export_config_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: #ffffff;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 16px;
-                font-weight: bold;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #f1c40f;
-            }
-            QPushButton:pressed {
-                background-color: #d68910;
-            }
-        """)
+        self.export_config_btn.setStyleSheet(_EXPORT_CONFIG_BTN_QSS)
         self.export_config_btn.clicked.connect(self.export_config_to_csv_from_settings)
         csv_buttons_layout.addWidget(self.export_config_btn)
         
         # Import Config button
         self.import_config_btn = QPushButton("Import Config")
-        self.import_config_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: #ffffff;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 16px;
-                font-weight: bold;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #ec7063;
-            }
-            QPushButton:pressed {
-                background-color: #c0392b;
-            }
-        """)
+        self.import_config_btn.setStyleSheet(_IMPORT_CONFIG_BTN_QSS)
         self.import_config_btn.clicked.connect(self.import_config_from_csv)
         csv_buttons_layout.addWidget(self.import_config_btn)
         
         # Open CSV Folder button
         self.open_folder_btn = QPushButton("Open CSV Folder")
-        self.open_folder_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9b59b6;
-                color: #ffffff;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 16px;
-                font-weight: bold;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #af7ac5;
-            }
-            QPushButton:pressed {
-                background-color: #7d3c98;
-            }
-        """)
+        self.open_folder_btn.setStyleSheet(_OPEN_FOLDER_BTN_QSS)
         self.open_folder_btn.clicked.connect(self.open_csv_folder)
         csv_buttons_layout.addWidget(self.open_folder_btn)
         
@@ -2194,8 +2737,12 @@ class AlertDisplay(QWidget):
         
         dialog.exec()
     
-    def validate_folder_path(self):
-        """Validate the folder path in real-time"""
+    def schedule_folder_validation(self):
+        """Folder edit textChanged handler - (re)start the debounce timer"""
+        self._folder_validate_timer.start(250)
+    
+    def validate_folder_path(self, use_cache=False):
+        """Validate the folder path (use_cache=True reuses earlier probes of the same path while typing)"""
         folder_path = self.folder_edit.text().strip()
         
         if not folder_path:
@@ -2208,16 +2755,15 @@ class AlertDisplay(QWidget):
             self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(True)
             return True
         
-        # Check if path exists and is accessible
-        if os.path.exists(folder_path):
-            if os.path.isdir(folder_path):
-                # Check if we can write to this directory
-                try:
-                    test_file = os.path.join(folder_path, 'test_write.tmp')
-                    with open(test_file, 'w') as f:
-                        f.write('test')
-                    os.remove(test_file)
-                    
+        # Check if path exists and is accessible - typing uses the cheap cached check,
+        # opening the dialog and saving always do a real write test
+        state = self._folder_probe_cache.get(folder_path) if use_cache else None
+        if state is None:
+            state = self._folder_probe_cache[folder_path] = probe_folder(folder_path, write_test=not use_cache)
+        
+        if state != "missing":
+            if state != "not_dir":
+                if state == "writable":
                     self.folder_status_label.setText("✓ Valid folder with write access")
                     self.folder_status_label.setProperty("class", "status-label status-valid")
                     self.folder_status_label.setStyleSheet("color: #2ed573; background-color: #1b2d1b; font-size: 12px; padding: 5px; border-radius: 3px;")
@@ -2225,7 +2771,7 @@ class AlertDisplay(QWidget):
                     self.folder_edit.setStyleSheet("")
                     self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(True)
                     return True
-                except (PermissionError, OSError):
+                else:
                     self.folder_status_label.setText("✗ Folder exists but no write permission")
                     self.folder_status_label.setProperty("class", "status-label status-invalid")
                     self.folder_status_label.setStyleSheet("color: #ff4757; background-color: #3d1a1a; font-size: 12px; padding: 5px; border-radius: 3px;")
@@ -2251,36 +2797,41 @@ class AlertDisplay(QWidget):
             return False
     
     def load_settings(self):
-        """Load settings from settings.json"""
+        """Load settings from settings.json, re-reading only when the file's mtime changes"""
+        # (stamp, settings, checked_at) - read once, may be set by a worker thread
+        cached = self._settings_cache
+        if cached and time.monotonic() - cached[2] < 1.0:
+            # Checked within the last second (ack clicks, alarm refresh) - skip even the stat
+            return dict(cached[1])
         try:
-            # Try app_data/settings.json first (preferred location)
-            settings_path = os.path.join(os.path.dirname(__file__), 'app_data', 'settings.json')
-            if os.path.exists(settings_path):
-                with open(settings_path, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    # Ensure we have default values for missing keys
-                    return {
-                        'username': settings.get('username', ''),
-                        'data_folder': settings.get('data_folder', ''),
-                        'alarm_monitor': settings.get('alarm_monitor', 0),
-                        'keep_fullscreen_tv': settings.get('keep_fullscreen_tv', False)
-                    }
-            
-            # Fallback to root settings.json
-            settings_path = os.path.join(os.path.dirname(__file__), 'settings.json')
-            if os.path.exists(settings_path):
-                with open(settings_path, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    # Ensure we have default values for missing keys
-                    return {
-                        'username': settings.get('username', ''),
-                        'data_folder': settings.get('data_folder', ''),
-                        'alarm_monitor': settings.get('alarm_monitor', 0),
-                        'keep_fullscreen_tv': settings.get('keep_fullscreen_tv', False)
-                    }
+            # Try app_data/settings.json first (preferred location), then root settings.json
+            for settings_path in self._settings_paths:
+                try:
+                    mtime = os.stat(settings_path).st_mtime_ns
+                except OSError:
+                    continue
+                
+                stamp = (settings_path, mtime)
+                if cached and cached[0] == stamp:
+                    self._settings_cache = (stamp, cached[1], time.monotonic())
+                    return dict(cached[1])
+                
+                with open(settings_path, 'rb') as f:
+                    settings = _load_json(f)
+                # Ensure we have default values for missing keys
+                settings = {
+                    'username': settings.get('username', ''),
+                    'data_folder': settings.get('data_folder', ''),
+                    'alarm_monitor': settings.get('alarm_monitor', 0),
+                    'keep_fullscreen_tv': settings.get('keep_fullscreen_tv', False),
+                    'min_flash_interval_ms': settings.get('min_flash_interval_ms', 250)
+                }
+                self._settings_cache = (stamp, settings, time.monotonic())
+                return dict(settings)
         except Exception:
             pass
-        return {'username': '', 'data_folder': '', 'alarm_monitor': 0, 'keep_fullscreen_tv': False}
+        return {'username': '', 'data_folder': '', 'alarm_monitor': 0, 'keep_fullscreen_tv': False,
+                'min_flash_interval_ms': 250}
     
     def save_settings_and_close(self, dialog, original_settings):
         """Save settings with validation and preserve existing values"""
@@ -2305,17 +2856,29 @@ class AlertDisplay(QWidget):
                 'username': final_username,
                 'data_folder': final_folder,
                 'alarm_monitor': final_monitor,
-                'keep_fullscreen_tv': final_tv_mode
+                'keep_fullscreen_tv': final_tv_mode,
+                'min_flash_interval_ms': original_settings.get('min_flash_interval_ms', 250)  # No UI - kept from file
             }
             
+            # OK without edits - nothing to write, reload or reapply
+            if settings == original_settings:
+                dialog.accept()
+                return
+            
             # Save to app_data/settings.json (preferred location)
-            settings_path = os.path.join(os.path.dirname(__file__), 'app_data', 'settings.json')
+            settings_path = self._settings_paths[0]
             
             # Ensure app_data directory exists
             os.makedirs(os.path.dirname(settings_path), exist_ok=True)
             
-            with open(settings_path, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2)
+            _atomic_json_dump(settings_path, settings, indent=2)
+            
+            # Data folder may have changed - resolve paths and reload data from scratch
+            self._settings_cache = None
+            self._ack_path = None
+            self._acknowledgments_path = None
+            self.invalidate_data_cache()
+            self.prefetch_ack_records()  # Data folder may point at a different ack.json
             
             # Handle TV mode changes
             if final_tv_mode:
@@ -2326,10 +2889,7 @@ class AlertDisplay(QWidget):
             # If alarm monitor changed and we have an active alert, move immediately
             old_monitor = original_settings.get('alarm_monitor', 0)
             if final_monitor != old_monitor and self.alert_active:
-                try:
-                    print(f"DEBUG: Monitor setting changed during active alarm, switching immediately")
-                except:
-                    pass  # Ignore console output errors
+                log.debug("Monitor setting changed during active alarm, switching immediately")
                 self.ensure_alarm_on_correct_monitor()
             
             QMessageBox.information(self, "Settings", "Settings saved successfully!")
@@ -2340,6 +2900,9 @@ class AlertDisplay(QWidget):
     
     def closeEvent(self, event):
         """Handle window close event with proper cleanup"""
+        # Write any acks still waiting for their queued flush
+        self._flush_acks()
+        
         # Stop all alarms first
         self.stop_all_alarms()
         
@@ -2350,12 +2913,12 @@ class AlertDisplay(QWidget):
         if self.refresh_timer:
             self.refresh_timer.stop()
             self.refresh_timer = None
+        if self.reload_timer:
+            self.reload_timer.stop()
+            self.reload_timer = None
         if self.flash_timer:
             self.flash_timer.stop()
             self.flash_timer = None
-        if self.pause_timer:
-            self.pause_timer.stop()
-            self.pause_timer = None
         if hasattr(self, 'tv_fullscreen_timer') and self.tv_fullscreen_timer:
             self.tv_fullscreen_timer.stop()
             self.tv_fullscreen_timer = None
@@ -2366,14 +2929,107 @@ class AlertDisplay(QWidget):
             self.snooze_countdown_timer.stop()
             self.snooze_countdown_timer = None
         
-        # Clean up status cards
+        # Clean up status cards - deferred deletes are batched by the event loop
         for card in self.status_cards.values():
-            card.setParent(None)
+            card.deleteLater()
         self.status_cards.clear()
         
         # Accept the close event
         event.accept()
     
+    def load_ack_records(self, ack_path):
+        """All entries in ack.json and a (date, manifest_time, carrier) index, reused while its mtime and size are unchanged"""
+        cached = self._ack_records  # (stamp, ack_data, ack_index)
+        if cached and self._ack_dirty and cached[0][0] == ack_path:
+            # Unwritten acks are only in memory - keep adding to them until the flush
+            return cached[1], cached[2]
+        
+        try:
+            stamp = ack_file_stamp(ack_path)
+        except OSError:
+            stamp = (ack_path, None, None)  # No file yet - the first flush creates it
+        
+        if cached and cached[0] == stamp:
+            return cached[1], cached[2]
+        
+        self._ack_records = read_ack_records(stamp)
+        return self._ack_records[1], self._ack_records[2]
+    
+    def prefetch_ack_records(self):
+        """Parse ack.json on the thread pool so the first ack click doesn't load a large file on the GUI thread"""
+        worker = AckLoadWorker(self.get_ack_path())
+        worker.signals.loaded.connect(self.on_ack_records_loaded)
+        self._ack_prefetch = worker.signals  # Keep the signal object alive until it reports back
+        QThreadPool.globalInstance().start(worker)
+    
+    def on_ack_records_loaded(self, records):
+        """Adopt prefetched ack records unless an ack already loaded or changed them in the meantime"""
+        self._ack_prefetch = None
+        cached = self._ack_records
+        if self._ack_dirty or (cached and cached[0] == records[0]):
+            return
+        if records[0][0] == self.get_ack_path():
+            # A stale prefetch is harmless - load_ack_records re-reads when the stamp differs
+            self._ack_records = records
+    
+    def commit_acks(self, new_acks):
+        """Show new ack entries straight away and queue one ack.json write for this event-loop tick"""
+        if not new_acks:
+            return
+        
+        # The display lookup holds today's acks keyed like the index - add to it rather than re-reading the file
+        if self._cached_acks is None:
+            self._cached_acks = {}
+        for ack in new_acks:
+            self._cached_acks[(ack['date'], ack['manifest_time'], ack['carrier'])] = ack
+        self._last_fingerprint = None
+        
+        self._ack_pending.extend(new_acks)
+        self._ack_dirty = True
+        if not self._ack_flush_scheduled:
+            self._ack_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_acks)
+    
+    def _flush_acks(self):
+        """Write the in-memory ack list to ack.json once - on failure the new acks stay queued for a retry"""
+        self._ack_flush_scheduled = False
+        if not self._ack_dirty or not self._ack_records:
+            return
+        self._ack_dirty = False
+        
+        stamp, ack_data, ack_index = self._ack_records
+        ack_path = stamp[0]
+        try:
+            try:
+                on_disk = ack_file_stamp(ack_path)
+            except FileNotFoundError:
+                on_disk = (ack_path, None, None)
+            if on_disk != stamp:
+                # Another station wrote since we loaded (or while a retry waited) - add our acks to its file
+                stamp, ack_data, ack_index = read_ack_records(on_disk)
+                for ack in self._ack_pending:
+                    key = (ack['date'], ack['manifest_time'], ack['carrier'])
+                    if key not in ack_index:
+                        ack_data.append(ack)
+                        ack_index[key] = ack
+                self._ack_records = (stamp, ack_data, ack_index)
+            
+            _atomic_json_dump(ack_path, ack_data)
+            # Restamp so our own write doesn't force a re-parse
+            self._ack_records = (ack_file_stamp(ack_path), ack_data, ack_index)
+            self._ack_pending = []
+            self._ack_flush_failed = False
+        except Exception as e:
+            # Keep the new acks queued and try again shortly - warn once, not on every retry
+            self._ack_dirty = True
+            if not self._ack_flush_scheduled:
+                self._ack_flush_scheduled = True
+                QTimer.singleShot(5000, self._flush_acks)
+            if not self._ack_flush_failed:
+                self._ack_flush_failed = True
+                QMessageBox.warning(self, "Error", f"Failed to save acknowledgment: {e}\n\n"
+                                                   f"It is kept and will be saved again automatically.")
+    
     def acknowledge_time_slot(self, time_str):
         """Acknowledge all items in a time slot"""
         if time_str not in self.status_cards:
@@ -2383,81 +3039,14 @@ class AlertDisplay(QWidget):
         if not card.manifests:
             return
         
-        # Set flag to prevent window restoration during acknowledgment
-        self.acknowledging_in_progress = True
-        
-        # Get username from settings
-        settings = self.load_settings()
-        username = settings.get('username', '').strip()
-        
-        if not username:
-            self.acknowledging_in_progress = False
-            QMessageBox.warning(self, "No Username", 
-                              "Please set your username in Settings before acknowledging.")
-            return
-        
-        # Determine if this is a late acknowledgment (any missed items)
-        has_missed = any(status == "Missed" for _, status in card.manifests)
-        
-        # Save acknowledgments immediately
-        try:
-            current_time = datetime.now()
-            today = current_time.date().isoformat()
-            timestamp = current_time.isoformat()
-            
-            # Load existing acknowledgments using centralized path method
-            ack_path = self.get_ack_path()
-            
-            # Load existing data
-            ack_data = []
-            if os.path.exists(ack_path):
-                try:
-                    with open(ack_path, 'r', encoding='utf-8') as f:
-                        ack_data = json.load(f)
-                except:
-                    ack_data = []
-            
-            # Add acknowledgments for all carriers in this time slot
-            for carrier, status in card.manifests:
-                # Check if already acknowledged
-                existing_ack = None
-                for ack in ack_data:
-                    if (ack.get('date') == today and 
-                        ack.get('manifest_time') == time_str and 
-                        ack.get('carrier') == carrier):
-                        existing_ack = ack
-                        break
-                
-                if not existing_ack:
-                    # Add new acknowledgment (reason will be added via popup in Phase 3)
-                    ack_entry = {
-                        'date': today,
-                        'manifest_time': time_str,
-                        'carrier': carrier,
-                        'user': username,
-                        'reason': '',  # Will be populated via popup
-                        'timestamp': timestamp
-                    }
-                    ack_data.append(ack_entry)
-            
-            # Save to file
-            with open(ack_path, 'w', encoding='utf-8') as f:
-                json.dump(ack_data, f, indent=2)
-            
-            # Refresh display immediately to show changes
-            self.populate_data()
-            
-            # Clear acknowledgment flag after data refresh
-            self.acknowledging_in_progress = False
-            
-            # No success dialog - visual feedback from card color change is sufficient
-            
-        except Exception as e:
-            self.acknowledging_in_progress = False
-            QMessageBox.warning(self, "Error", f"Failed to save acknowledgment: {e}")
+        self.add_acknowledgments(time_str, [carrier for carrier, _ in card.manifests])
     
     def acknowledge_single_carrier(self, time_str, carrier):
         """Acknowledge a single carrier for a specific time"""
+        self.add_acknowledgments(time_str, [carrier])
+    
+    def add_acknowledgments(self, time_str, carriers):
+        """Record acks by the current user for carriers at time_str - already acknowledged carriers are skipped"""
         # Set flag to prevent window restoration during acknowledgment
         self.acknowledging_in_progress = True
         
@@ -2471,16 +3060,6 @@ class AlertDisplay(QWidget):
                               "Please set your username in Settings before acknowledging.")
             return
         
-        # Determine if this is a late acknowledgment based on card status
-        is_late = False
-        if time_str in self.status_cards:
-            card = self.status_cards[time_str]
-            # Check if this specific carrier is in missed status
-            for car, status in card.manifests:
-                if car == carrier and status == "Missed":
-                    is_late = True
-                    break
-        
         try:
             current_time = datetime.now()
             today = current_time.date().isoformat()
@@ -2489,25 +3068,16 @@ class AlertDisplay(QWidget):
             # Load existing acknowledgments using centralized path method
             ack_path = self.get_ack_path()
             
-            # Load existing data
-            ack_data = []
-            if os.path.exists(ack_path):
-                try:
-                    with open(ack_path, 'r', encoding='utf-8') as f:
-                        ack_data = json.load(f)
-                except:
-                    ack_data = []
-            
-            # Check if already acknowledged
-            existing_ack = None
-            for ack in ack_data:
-                if (ack.get('date') == today and 
-                    ack.get('manifest_time') == time_str and 
-                    ack.get('carrier') == carrier):
-                    existing_ack = ack
-                    break
+            # Full ack list plus (date, time, carrier) index - parsed only when the file changed
+            ack_data, ack_index = self.load_ack_records(ack_path)
             
-            if not existing_ack:
+            new_acks = []
+            for carrier in carriers:
+                # Check if already acknowledged
+                key = (today, time_str, carrier)
+                if key in ack_index:
+                    continue
+                
                 # Add new acknowledgment (reason will be added via popup in Phase 3)
                 ack_entry = {
                     'date': today,
@@ -2518,19 +3088,18 @@ class AlertDisplay(QWidget):
                     'timestamp': timestamp
                 }
                 ack_data.append(ack_entry)
-                
-                # Save to file
-                with open(ack_path, 'w', encoding='utf-8') as f:
-                    json.dump(ack_data, f, indent=2)
-                
-                # Refresh display immediately to show changes
-                self.populate_data()
-                
-                # Clear acknowledgment flag after data refresh
-                self.acknowledging_in_progress = False
-            else:
-                # Clear acknowledgment flag if no new acknowledgment was made
-                self.acknowledging_in_progress = False
+                ack_index[key] = ack_entry
+                new_acks.append(ack_entry)
+            
+            # Queue the file write and refresh display immediately to show changes
+            # (nothing new leaves the fingerprint unchanged, so the refresh is a no-op)
+            self.commit_acks(new_acks)
+            self.populate_data(reload_files=False)
+            
+            # Clear acknowledgment flag after data refresh
+            self.acknowledging_in_progress = False
+            
+            # No success dialog - visual feedback from card color change is sufficient
             
         except Exception as e:
             self.acknowledging_in_progress = False
@@ -2561,7 +3130,6 @@ class AlertDisplay(QWidget):
     def update_fullscreen_icon(self):
         """Update fullscreen button icon based on current window state"""
         # Use a delayed check to ensure window state has fully changed
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(100, self._delayed_icon_update)
     
     def _delayed_icon_update(self):
@@ -2573,37 +3141,11 @@ class AlertDisplay(QWidget):
 
     def show_monitor_menu(self):
         """Show monitor selection menu"""
-        from PyQt6.QtWidgets import QMenu
-        
         menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #1a1a2e;
-                color: #ffffff;
-                border: 2px solid #3742fa;
-                border-radius: 8px;
-                padding: 5px;
-                font-size: 14px;
-            }
-            QMenu::item {
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background-color: #3742fa;
-            }
-        """)
-        
-        # Get available screens
-        screens = QApplication.screens()
+        menu.setStyleSheet(_MONITOR_MENU_QSS)
         
-        for i, screen in enumerate(screens):
-            # Get screen geometry and name
-            geometry = screen.geometry()
-            name = screen.name() if hasattr(screen, 'name') and screen.name() else f"Monitor {i+1}"
-            resolution = f"{geometry.width()}x{geometry.height()}"
-            
-            action_text = f"{name} ({resolution})"
+        # One entry per available screen
+        for i, action_text in enumerate(self.get_screen_labels()):
             action = menu.addAction(action_text)
             action.triggered.connect(lambda checked, idx=i: self.move_to_monitor(idx))
         
@@ -2614,7 +3156,7 @@ class AlertDisplay(QWidget):
     def move_to_monitor(self, monitor_index):
         """Move window to specified monitor"""
         try:
-            screens = QApplication.screens()
+            screens = self.get_screens()
             if 0 <= monitor_index < len(screens):
                 target_screen = screens[monitor_index]
                 
@@ -2663,24 +3205,35 @@ class AlertDisplay(QWidget):
         
         if not data_folder:
             return None
-            
-        csv_folder = os.path.join(data_folder, 'csv')
-        return csv_folder
+        
+        # Joined once per data folder
+        if self._csv_folder[0] != data_folder:
+            self._csv_folder = (data_folder, os.path.join(data_folder, 'csv'))
+        return self._csv_folder[1]
     
     def ensure_csv_folder_exists(self):
         """Ensure CSV folder exists, create if needed"""
         csv_folder = self.get_csv_folder_path()
         if not csv_folder:
             return False
+        
+        # Created/confirmed within the last second (export then open-folder) - skip the makedirs
+        verified = self._csv_dir_verified  # (csv_folder, monotonic time)
+        if verified and verified[0] == csv_folder and time.monotonic() - verified[1] < 1.0:
+            return True
             
         try:
             os.makedirs(csv_folder, exist_ok=True)
+            self._csv_dir_verified = (csv_folder, time.monotonic())
             return True
         except Exception:
             return False
     
     def export_to_csv_from_settings(self):
         """Export acknowledgment data to CSV in data folder and open Excel"""
+        if self._csv_export is not None:
+            return  # Previous export still running
+        
         settings = self.load_settings()
         data_folder = settings.get('data_folder', '').strip()
         
@@ -2694,76 +3247,52 @@ class AlertDisplay(QWidget):
                                "Could not create CSV folder in data directory.")
             return
         
-        try:
-            # Load acknowledgment data
-            ack_path = self.get_acknowledgments_path()
-            if not os.path.exists(ack_path):
-                QMessageBox.information(self, "No Data", "No acknowledgment data found to export.")
-                return
-            
-            with open(ack_path, 'r') as f:
-                ack_data = json.load(f)
-            
-            if not ack_data:
-                QMessageBox.information(self, "No Data", "No acknowledgment data found to export.")
-                return
-            
-            # Generate filename with current date
-            current_date = datetime.now().strftime("%d%m%Y")
-            filename = f"manifest_ack-{current_date}.csv"
-            csv_folder = self.get_csv_folder_path()
-            file_path = os.path.join(csv_folder, filename)
-            
-            # Export CSV data
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # Write header
-                writer.writerow(['Date', 'Time', 'Carrier', 'User', 'Reason', 'Timestamp'])
-                
-                # Handle list format (correct format used by the system)
-                if isinstance(ack_data, list):
-                    for ack_item in ack_data:
-                        if isinstance(ack_item, dict):
-                            date = ack_item.get('date', '')
-                            time = ack_item.get('manifest_time', '')
-                            carrier = ack_item.get('carrier', '')
-                            user = ack_item.get('user', '')
-                            reason = ack_item.get('reason', '')
-                            timestamp = ack_item.get('timestamp', '')
-                            
-                            writer.writerow([date, time, carrier, user, reason, timestamp])
-                else:
-                    # Handle old nested dictionary format for backward compatibility
-                    for date_key, date_data in ack_data.items():
-                        if isinstance(date_data, dict):
-                            for time_key, time_data in date_data.items():
-                                if isinstance(time_data, dict):
-                                    user = time_data.get('user', '')
-                                    reason = time_data.get('reason', '')
-                                    timestamp = time_data.get('timestamp', '')
-                                    
-                                    writer.writerow([date_key, time_key, '', user, reason, timestamp])
-            
-            # Open in Excel
-            self.open_file_in_excel(file_path)
-            
-            QMessageBox.information(self, "Export Complete", 
-                                  f"Data exported successfully to:\n{file_path}\n\nOpening in Excel...")
-            
-        except PermissionError as e:
-            QMessageBox.critical(self, "Export Error", 
-                               f"Failed to export acknowledgment data:\n\n"
-                               f"The file may be open in Excel or another program.\n"
-                               f"Please close the file and try again.\n\n"
-                               f"File: {file_path}\n"
-                               f"Error: {str(e)}")
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", 
-                               f"Failed to export acknowledgment data:\n\n{str(e)}")
+        # Generate filename with current date
+        today = datetime.now()
+        current_date = f"{today.day:02d}{today.month:02d}{today.year}"
+        filename = f"manifest_ack-{current_date}.csv"
+        file_path = os.path.join(self.get_csv_folder_path(), filename)
+        
+        # Load and write on a pool thread - results come back via queued signals
+        self.start_csv_export(partial(write_ack_csv, self.get_acknowledgments_path()), file_path,
+                              "acknowledgment data", self.on_csv_export_finished)
+    
+    def start_csv_export(self, write_csv, file_path, what, on_finished):
+        """Run write_csv(file_path) on the global thread pool, reporting to on_finished / on_csv_export_failed"""
+        worker = CsvExportWorker(write_csv, file_path, what)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.failed.connect(self.on_csv_export_failed)
+        self._csv_export = worker.signals  # Keep the signal object alive until it reports back
+        QThreadPool.globalInstance().start(worker)
+    
+    def on_csv_export_finished(self, file_path):
+        """Report a finished acknowledgment export ('' when there was nothing to export)"""
+        self._csv_export = None
+        if not file_path:
+            QMessageBox.information(self, "No Data", "No acknowledgment data found to export.")
+            return
+        
+        # Open in Excel - back on the GUI thread
+        self.open_file_in_excel(file_path)
+        
+        self.show_export_complete(f"Data exported successfully to:\n{file_path}\n\nOpening in Excel...")
+    
+    def show_export_complete(self, text):
+        """'Export Complete' notice shown with open() - no nested event loop while Excel starts up"""
+        box = QMessageBox(QMessageBox.Icon.Information, "Export Complete", text, parent=self)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.open()
+    
+    def on_csv_export_failed(self, message):
+        """Report a failed acknowledgment export"""
+        self._csv_export = None
+        QMessageBox.critical(self, "Export Error", message)
     
     def export_config_to_csv_from_settings(self):
         """Export config data to CSV in data folder and open Excel"""
+        if self._csv_export is not None:
+            return  # Previous export still running
+        
         settings = self.load_settings()
         data_folder = settings.get('data_folder', '').strip()
         
@@ -2777,66 +3306,37 @@ class AlertDisplay(QWidget):
                                "Could not create CSV folder in data directory.")
             return
         
-        try:
-            # Load config data
-            config = self.load_config()
-            
-            if not config or not config.get('manifests'):
-                QMessageBox.information(self, "No Data", "No manifest configuration data found to export.")
-                return
-            
-            # Generate filename with current date
-            current_date = datetime.now().strftime("%d%m%Y")
-            filename = f"manifest_config-{current_date}.csv"
-            csv_folder = self.get_csv_folder_path()
-            file_path = os.path.join(csv_folder, filename)
-            
-            # Export in importable format
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # Write header matching import format
-                writer.writerow(['time', 'carriers'])
-                
-                # Write data rows in importable format
-                manifests = config.get('manifests', [])
-                for manifest in manifests:
-                    time_slot = manifest.get('time', '')
-                    carriers = manifest.get('carriers', [])
-                    # Join carriers with semicolon for easy import parsing
-                    carriers_str = ';'.join(carriers) if carriers else ''
-                    
-                    writer.writerow([time_slot, carriers_str])
-            
-            # Open in Excel
-            self.open_file_in_excel(file_path)
-            
-            QMessageBox.information(self, "Export Complete", 
-                                  f"Configuration exported successfully to:\n{file_path}\n\nFormat: time,carriers (semicolon-separated)\nThis file can be imported back into the system.\n\nOpening in Excel...")
-            
-        except PermissionError as e:
-            QMessageBox.critical(self, "Export Error", 
-                               f"Failed to export configuration data:\n\n"
-                               f"The file may be open in Excel or another program.\n"
-                               f"Please close the file and try again.\n\n"
-                               f"File: {file_path}\n"
-                               f"Error: {str(e)}")
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", 
-                               f"Failed to export configuration data:\n\n{str(e)}")
+        # Load config data
+        config = self.load_config()
+        
+        if not config or not config.get('manifests'):
+            QMessageBox.information(self, "No Data", "No manifest configuration data found to export.")
+            return
+        
+        # Generate filename with current date
+        today = datetime.now()
+        current_date = f"{today.day:02d}{today.month:02d}{today.year}"
+        filename = f"manifest_config-{current_date}.csv"
+        csv_folder = self.get_csv_folder_path()
+        file_path = os.path.join(csv_folder, filename)
+        
+        # Export in importable format on a pool thread
+        self.start_csv_export(partial(write_config_csv, config.get('manifests', [])), file_path,
+                              "configuration data", self.on_config_export_finished)
+    
+    def on_config_export_finished(self, file_path):
+        """Open a finished config export in Excel and report it"""
+        self._csv_export = None
+        
+        # Open in Excel - back on the GUI thread
+        self.open_file_in_excel(file_path)
+        
+        self.show_export_complete(f"Configuration exported successfully to:\n{file_path}\n\nFormat: time,carriers (semicolon-separated)\nThis file can be imported back into the system.\n\nOpening in Excel...")
     
     def open_file_in_excel(self, file_path):
         """Open file in Excel or default CSV application"""
         try:
-            import subprocess
-            import platform
-            
-            if platform.system() == 'Windows':
-                os.startfile(file_path)
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.call(['open', file_path])
-            else:  # Linux
-                subprocess.call(['xdg-open', file_path])
+            open_with_default_app(file_path)
         except Exception as e:
             print(f"Could not open file in Excel: {e}")
     
@@ -2849,63 +3349,26 @@ class AlertDisplay(QWidget):
                               "Please set a data folder in settings first.")
             return
         
-        if not os.path.exists(csv_folder):
-            if not self.ensure_csv_folder_exists():
-                QMessageBox.critical(self, "Folder Error", 
-                                   "Could not create CSV folder.")
-                return
+        # makedirs(exist_ok=True) covers the exists check - and is skipped right after an export
+        if not self.ensure_csv_folder_exists():
+            QMessageBox.critical(self, "Folder Error", 
+                               "Could not create CSV folder.")
+            return
         
         try:
-            import subprocess
-            import platform
-            
-            if platform.system() == 'Windows':
-                os.startfile(csv_folder)
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.call(['open', csv_folder])
-            else:  # Linux
-                subprocess.call(['xdg-open', csv_folder])
+            open_with_default_app(csv_folder)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not open folder:\n{str(e)}")
     
-    def create_backup_config(self):
-        """Create timestamped backup of current config"""
-        try:
-            settings = self.load_settings()
-            data_folder = settings.get('data_folder', '').strip()
-            
-            if not data_folder:
-                return False
-            
-            # Create backup folder if it doesn't exist
-            backup_folder = os.path.join(data_folder, 'backup')
-            os.makedirs(backup_folder, exist_ok=True)
-            
-            # Get current config path
-            config_path = os.path.join(data_folder, 'config.json')
-            if not os.path.exists(config_path):
-                return False
-            
-            # Create timestamped backup
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"config_backup_{timestamp}.json"
-            backup_path = os.path.join(backup_folder, backup_filename)
-            
-            # Copy file
-            import shutil
-            shutil.copy2(config_path, backup_path)
-            
-            return True
-            
-        except Exception as e:
-            try:
-                print(f"Backup creation failed: {e}")
-            except:
-                pass  # Ignore console output errors
-            return False
-    
     def import_config_from_csv(self):
         """Import configuration from CSV file with backup"""
+        if self._config_import is not None:
+            # Checked before the file dialog so the user's pick isn't silently dropped
+            QMessageBox.information(self, "Import In Progress",
+                                    "The previous import is still backing up config.json.\n"
+                                    "Please try again in a moment.")
+            return
+        
         settings = self.load_settings()
         data_folder = settings.get('data_folder', '').strip()
         
@@ -2915,24 +3378,37 @@ class AlertDisplay(QWidget):
             return
         
         # Open file dialog in the CSV folder
-        csv_folder = os.path.join(data_folder, 'csv')
+        csv_folder = self.get_csv_folder_path()
         if not os.path.exists(csv_folder):
             csv_folder = data_folder  # Fallback to data folder
         
-        # Get CSV file from user
+        # Get CSV file from user - skip the per-entry icon/symlink probes that stall on network shares
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Import Configuration",
             csv_folder,  # Start in CSV folder
-            "CSV files (*.csv);;All files (*.*)"
+            "CSV files (*.csv);;All files (*.*)",
+            options=(QFileDialog.Option.DontUseCustomDirectoryIcons |
+                     QFileDialog.Option.DontResolveSymlinks |
+                     QFileDialog.Option.ReadOnly)
         )
         
         if not file_path:
             return  # User cancelled
         
+        # Create backup first - copied on the thread pool, the import continues in on_config_backup_finished
+        worker = ConfigBackupWorker(data_folder)
+        worker.signals.finished.connect(self.on_config_backup_finished)
+        self._config_import = (worker.signals, file_path, data_folder)
+        QThreadPool.globalInstance().start(worker)
+    
+    def on_config_backup_finished(self, backed_up):
+        """Continue a CSV config import once its config.json backup has been attempted"""
+        _, file_path, data_folder = self._config_import
+        self._config_import = None
+        
         try:
-            # Create backup first
-            if not self.create_backup_config():
+            if not backed_up:
                 if not QMessageBox.question(self, "Backup Failed", 
                                            "Could not create backup. Continue with import?",
                                            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) == QMessageBox.StandardButton.Yes:
@@ -2951,11 +3427,8 @@ class AlertDisplay(QWidget):
                         time_slot = row[0].strip()
                         carriers_str = row[1].strip()
                         
-                        # Parse carriers (semicolon-separated)
-                        if carriers_str:
-                            carriers = [c.strip() for c in carriers_str.split(';') if c.strip()]
-                        else:
-                            carriers = []
+                        # Parse carriers (semicolon-separated, trimmed, empties dropped) in one scan
+                        carriers = _CARRIER_RE.findall(carriers_str)
                         
                         if time_slot and carriers:
                             manifests.append({
@@ -2974,10 +3447,10 @@ class AlertDisplay(QWidget):
             
             # Save new config
             config_path = os.path.join(data_folder, 'config.json')
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(new_config, f, indent=2)
+            _atomic_json_dump(config_path, new_config, indent=2, durable=True)
             
             # Refresh display
+            self.invalidate_data_cache()
             self.populate_data()
             
             QMessageBox.information(self, "Import Complete", 
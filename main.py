@@ -3,7 +3,7 @@ import os
 from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
 from PyQt6.QtGui import QIcon, QAction
 from PyQt6.QtCore import Qt
-from alert_display import AlertDisplay
+from alert_display import AlertDisplay, get_app_icon
 
 if __name__ == "__main__":
     # Hide console window in production (when run with pythonw.exe)
@@ -31,9 +31,9 @@ if __name__ == "__main__":
     app.setOrganizationName("Warehouse Systems")
     
     # Set application icon for taskbar display
-    icon_path = os.path.join(os.path.dirname(__file__), 'resources', 'icon.ico')
-    if os.path.exists(icon_path):
-        app.setWindowIcon(QIcon(icon_path))
+    app_icon = get_app_icon()
+    if not app_icon.isNull():
+        app.setWindowIcon(app_icon)
     
     # Windows-specific: Set application ID to avoid Python grouping in taskbar
     try:
@@ -1,11 +1,20 @@
 from datetime import datetime, timedelta
 from data_manager import load_config
 
-def get_manifest_status(manifest_time_str, now=None):
+def parse_manifest_time(manifest_time_str):
+    """Parse "HH:MM" into an (hour, minute) tuple - much cheaper than strptime"""
+    hour, minute = manifest_time_str.split(':')
+    return int(hour), int(minute)
+
+def get_manifest_status(manifest_time, now=None):
+    """Status of a manifest - manifest_time is "HH:MM" or a pre-parsed (hour, minute) tuple"""
     if now is None:
         now = datetime.now()
-    today = now.date()
-    manifest_time = datetime.strptime(manifest_time_str, "%H:%M").replace(year=today.year, month=today.month, day=today.day)
+    if isinstance(manifest_time, str):
+        hour, minute = parse_manifest_time(manifest_time)
+    else:
+        hour, minute = manifest_time
+    manifest_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
     active_start = manifest_time - timedelta(minutes=2)
     active_end = manifest_time + timedelta(minutes=30)
 
@@ -0,0 +1,240 @@
+"""
+Unit tests for the module-level helpers in alert_display.
+"""
+
+import unittest
+import sys
+import os
+import csv
+import json
+import shutil
+import tempfile
+import types
+from datetime import datetime
+from unittest.mock import patch
+
+# Add the project root to the path so we can import the legacy modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+try:
+    import alert_display
+except ImportError:  # PyQt6 / QtMultimedia not available in this environment
+    alert_display = None
+
+
+@unittest.skipIf(alert_display is None, "alert_display needs PyQt6 with QtMultimedia")
+class AlertDisplayHelperTestCase(unittest.TestCase):
+    """Base class with a scratch folder per test."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+    
+    def path(self, name):
+        return os.path.join(self.temp_dir, name)
+
+
+class TestProbeFolder(AlertDisplayHelperTestCase):
+    """Test cases for probe_folder."""
+    
+    def test_missing_and_not_dir(self):
+        """Test missing paths and files are reported before any write check."""
+        open(self.path('file.txt'), 'w').close()
+        for write_test in (False, True):
+            self.assertEqual(alert_display.probe_folder(self.path('missing'), write_test), "missing")
+            self.assertEqual(alert_display.probe_folder(self.path('file.txt'), write_test), "not_dir")
+    
+    def test_write_test_leaves_folder_unchanged(self):
+        """Test the real write probe reports a writable folder and removes its test file."""
+        self.assertEqual(alert_display.probe_folder(self.temp_dir), "writable")
+        self.assertEqual(alert_display.probe_folder(self.temp_dir, write_test=True), "writable")
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+
+class TestReadAckRecords(AlertDisplayHelperTestCase):
+    """Test cases for ack_file_stamp and read_ack_records."""
+    
+    def write_acks(self, acks):
+        with open(self.path('ack.json'), 'w', encoding='utf-8') as f:
+            json.dump(acks, f)
+        return alert_display.ack_file_stamp(self.path('ack.json'))
+    
+    def test_stamp_changes_with_size_in_same_mtime_tick(self):
+        """Test another PC's write within one coarse mtime tick still changes the stamp."""
+        first = self.write_acks([])
+        os.utime(self.path('ack.json'), ns=(first[1], first[1]))
+        
+        self.write_acks([{"carrier": "DHL"}])
+        os.utime(self.path('ack.json'), ns=(first[1], first[1]))
+        second = alert_display.ack_file_stamp(self.path('ack.json'))
+        
+        self.assertEqual(second[1], first[1])
+        self.assertNotEqual(second, first)
+    
+    def test_missing_file_gives_empty_records(self):
+        """Test a missing ack.json starts a fresh list."""
+        stamp = (self.path('ack.json'), None, None)
+        self.assertEqual(alert_display.read_ack_records(stamp), (stamp, [], {}))
+    
+    def test_invalid_json_gives_empty_records(self):
+        """Test unreadable JSON starts a fresh list."""
+        with open(self.path('ack.json'), 'w', encoding='utf-8') as f:
+            f.write('{not json')
+        stamp = alert_display.ack_file_stamp(self.path('ack.json'))
+        self.assertEqual(alert_display.read_ack_records(stamp), (stamp, [], {}))
+    
+    def test_index_is_first_wins_for_duplicate_keys(self):
+        """Test the first ack for a (date, time, carrier) key is the indexed one."""
+        acks = [
+            {"date": "2025-07-23", "manifest_time": "10:00", "carrier": "DHL", "user": "first"},
+            {"date": "2025-07-23", "manifest_time": "10:00", "carrier": "DHL", "user": "second"},
+            {"date": "2025-07-23", "manifest_time": "10:00", "carrier": "Toll", "user": "third"},
+        ]
+        stamp = self.write_acks(acks)
+        
+        result_stamp, ack_data, ack_index = alert_display.read_ack_records(stamp)
+        
+        self.assertEqual(result_stamp, stamp)
+        self.assertEqual(ack_data, acks)  # Duplicates stay in the list
+        self.assertEqual(len(ack_index), 2)
+        self.assertEqual(ack_index[("2025-07-23", "10:00", "DHL")]["user"], "first")
+        self.assertEqual(ack_index[("2025-07-23", "10:00", "Toll")]["user"], "third")
+
+
+class TestAtomicJsonDump(AlertDisplayHelperTestCase):
+    """Test cases for _atomic_json_dump."""
+    
+    def test_replaces_file_without_leaving_temp(self):
+        """Test the target is replaced and no .tmp file is left behind."""
+        file_path = self.path('ack.json')
+        alert_display._atomic_json_dump(file_path, [{"carrier": "old"}])
+        alert_display._atomic_json_dump(file_path, [{"carrier": "Müller"}], indent=2, durable=True)
+        
+        with open(file_path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), [{"carrier": "Müller"}])
+        self.assertEqual(os.listdir(self.temp_dir), ['ack.json'])
+    
+    def test_retries_replace_on_sharing_violation(self):
+        """Test a briefly locked target is retried instead of failing the write."""
+        file_path = self.path('ack.json')
+        real_replace = os.replace
+        calls = []
+        
+        def locked_twice(src, dst):
+            calls.append(dst)
+            if len(calls) < 3:
+                raise PermissionError("file is open on another station")
+            real_replace(src, dst)
+        
+        with patch.object(alert_display.os, 'replace', locked_twice), patch.object(alert_display.time, 'sleep'):
+            alert_display._atomic_json_dump(file_path, [{"carrier": "DHL"}])
+        
+        self.assertEqual(len(calls), 3)
+        with open(file_path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), [{"carrier": "DHL"}])
+    
+    def test_failed_replace_removes_temp(self):
+        """Test a failed write removes the .tmp file and re-raises."""
+        target = self.path('config.json')
+        os.mkdir(target)  # os.replace can't put a file over a directory
+        
+        with self.assertRaises(OSError):
+            alert_display._atomic_json_dump(target, {"manifests": []})
+        
+        self.assertFalse(os.path.exists(target + '.tmp'))
+
+
+@unittest.skipIf(alert_display is None, "alert_display needs PyQt6 with QtMultimedia")
+class TestCurrentSlotStatuses(unittest.TestCase):
+    """Test cases for the slot statuses behind the populate_data skip."""
+    
+    def test_statuses_only_change_at_boundaries(self):
+        """Test slot statuses are equal between boundaries and differ across one."""
+        # Only _parsed_times is read, so no window is needed
+        display = types.SimpleNamespace(_parsed_times={"10:00": (10, 0), "12:00": (12, 0)})
+        statuses = alert_display.AlertDisplay.current_slot_statuses
+        
+        self.assertEqual(statuses(display, datetime(2025, 7, 23, 9, 0)),
+                         statuses(display, datetime(2025, 7, 23, 9, 57, 59)))
+        self.assertNotEqual(statuses(display, datetime(2025, 7, 23, 9, 57, 59)),
+                            statuses(display, datetime(2025, 7, 23, 9, 58)))
+        self.assertEqual(statuses(display, datetime(2025, 7, 23, 10, 30)), ("Missed", "Pending"))
+
+
+@unittest.skipIf(alert_display is None, "alert_display needs PyQt6 with QtMultimedia")
+class TestSecondsUntilNextTransition(unittest.TestCase):
+    """Test cases for the refresh_timer scheduling helper."""
+    
+    def test_finds_next_boundary_across_slots(self):
+        """Test the next Active/Missed boundary is found across all slots."""
+        display = types.SimpleNamespace(_parsed_times={"10:00": (10, 0), "12:00": (12, 0)})
+        until = alert_display.AlertDisplay.seconds_until_next_transition
+        
+        self.assertEqual(until(display, datetime(2025, 7, 23, 9, 57)), 60)  # 10:00 goes Active at 09:58
+        self.assertEqual(until(display, datetime(2025, 7, 23, 9, 58)), 32 * 60)  # Missed at 10:30
+        self.assertEqual(until(display, datetime(2025, 7, 23, 10, 30)), 88 * 60)  # 12:00 Active at 11:58
+    
+    def test_none_after_last_boundary(self):
+        """Test nothing is scheduled once every slot is Missed."""
+        display = types.SimpleNamespace(_parsed_times={"10:00": (10, 0)})
+        until = alert_display.AlertDisplay.seconds_until_next_transition
+        
+        self.assertIsNone(until(display, datetime(2025, 7, 23, 10, 30)))
+
+
+class TestWriteConfigCsv(AlertDisplayHelperTestCase):
+    """Test cases for write_config_csv."""
+    
+    manifests = [
+        {"time": "10:00", "carriers": ["A", "B,C"]},
+        {"time": "11:00", "carriers": []},
+        {"carriers": None},
+    ]
+    
+    def read_rows(self, file_path):
+        with open(file_path, newline='', encoding='utf-8') as f:
+            return list(csv.reader(f))
+    
+    def test_writes_importable_rows(self):
+        """Test the export uses the time,carriers import format."""
+        file_path = self.path('config.csv')
+        
+        self.assertTrue(alert_display.write_config_csv(self.manifests, file_path))
+        
+        self.assertEqual(self.read_rows(file_path),
+                         [["time", "carriers"], ["10:00", "A;B,C"], ["11:00", ""], ["", ""]])
+    
+    def test_reexport_always_rewrites(self):
+        """Test a re-export replaces edits made to the previous file, even same-size ones."""
+        file_path = self.path('config.csv')
+        alert_display.write_config_csv(self.manifests, file_path)
+        with open(file_path, 'r+', encoding='utf-8') as f:
+            f.write('TIME')  # Same-size edit, as if changed in Excel
+        
+        alert_display.write_config_csv(self.manifests, file_path)
+        
+        self.assertEqual(self.read_rows(file_path)[0], ["time", "carriers"])
+        self.assertEqual(os.listdir(self.temp_dir), ['config.csv'])  # No sidecar files
+
+
+class TestCarrierRegex(AlertDisplayHelperTestCase):
+    """Test cases for splitting imported carrier lists."""
+    
+    def test_trims_and_drops_empty_entries(self):
+        """Test surrounding whitespace and empty entries are dropped."""
+        self.assertEqual(alert_display._CARRIER_RE.findall(" X ; Y;;Z "), ["X", "Y", "Z"])
+    
+    def test_keeps_inner_spaces(self):
+        """Test spaces inside a carrier name are kept."""
+        self.assertEqual(alert_display._CARRIER_RE.findall("Australia Post Metro ;DHL Express"),
+                         ["Australia Post Metro", "DHL Express"])
+    
+    def test_blank_input_gives_no_carriers(self):
+        """Test blank and separator-only strings give no carriers."""
+        for value in ("", "   ", ";;", " ; ; "):
+            self.assertEqual(alert_display._CARRIER_RE.findall(value), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
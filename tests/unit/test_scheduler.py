@@ -0,0 +1,62 @@
+"""
+Unit tests for the legacy scheduler status helpers.
+"""
+
+import unittest
+import sys
+import os
+from datetime import datetime
+
+# Add the project root to the path so we can import the legacy modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from scheduler import parse_manifest_time, get_manifest_status
+
+
+class TestParseManifestTime(unittest.TestCase):
+    """Test cases for parse_manifest_time."""
+    
+    def test_parses_hour_and_minute(self):
+        """Test "HH:MM" becomes an (hour, minute) tuple."""
+        self.assertEqual(parse_manifest_time("07:05"), (7, 5))
+        self.assertEqual(parse_manifest_time("23:59"), (23, 59))
+    
+    def test_invalid_time_raises_value_error(self):
+        """Test malformed times raise ValueError like strptime did."""
+        for bad in ("0700", "ab:cd", "07:00:00", ""):
+            with self.assertRaises(ValueError):
+                parse_manifest_time(bad)
+
+
+class TestGetManifestStatus(unittest.TestCase):
+    """Test cases for get_manifest_status window boundaries."""
+    
+    def at(self, hour, minute, second=0):
+        return datetime(2025, 7, 23, hour, minute, second)
+    
+    def test_pending_before_active_window(self):
+        """Test manifest is Pending until 2 minutes before its time."""
+        self.assertEqual(get_manifest_status("10:00", self.at(9, 57, 59)), "Pending")
+    
+    def test_active_from_two_minutes_before(self):
+        """Test Active starts exactly 2 minutes before the manifest time."""
+        self.assertEqual(get_manifest_status("10:00", self.at(9, 58)), "Active")
+        self.assertEqual(get_manifest_status("10:00", self.at(10, 0)), "Active")
+    
+    def test_active_until_thirty_minutes_after(self):
+        """Test Active lasts until just before 30 minutes after the manifest time."""
+        self.assertEqual(get_manifest_status("10:00", self.at(10, 29, 59)), "Active")
+    
+    def test_missed_from_thirty_minutes_after(self):
+        """Test Missed starts exactly 30 minutes after the manifest time."""
+        self.assertEqual(get_manifest_status("10:00", self.at(10, 30)), "Missed")
+        self.assertEqual(get_manifest_status("10:00", self.at(23, 59)), "Missed")
+    
+    def test_parsed_tuple_matches_string(self):
+        """Test a pre-parsed (hour, minute) tuple gives the same status as "HH:MM"."""
+        for now in (self.at(9, 57, 59), self.at(9, 58), self.at(10, 29, 59), self.at(10, 30)):
+            self.assertEqual(get_manifest_status((10, 0), now), get_manifest_status("10:00", now))
+
+
+if __name__ == '__main__':
+    unittest.main()